@@ -6,6 +6,9 @@ for the Purrify system optimization utility.
 """
 
 import os
+import copy
+import functools
+import json
 import yaml
 import platform
 from pathlib import Path
@@ -13,6 +16,68 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
 from loguru import logger
 
+# Buffer size for writing the config file
+CONFIG_WRITE_BUFFER = 1 << 16
+
+# Parsed copy of the YAML config kept next to it, reused while the YAML is unchanged
+CONFIG_CACHE_SUFFIX = ".cache.json"
+
+
+def _is_json_safe(value: Any) -> bool:
+    """Check that ``value`` survives a JSON round-trip unchanged."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_safe(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _is_json_safe(item) for key, item in value.items())
+    return False  # dates, sets, bytes, tuples...
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_data(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, going through its JSON cache.
+    
+    Memoized on ``(path, mtime_ns, size)`` so repeated loads in one process
+    skip the disk; callers must copy the result before mutating it. The
+    JSON cache records the YAML file's mtime and size and is only used
+    while both still match. It is only written when the parsed YAML holds
+    plain JSON types, so values like dates never come back as strings.
+    """
+    config_file = Path(path)
+    cache_file = config_file.with_name(config_file.name + CONFIG_CACHE_SUFFIX)
+    
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['__src_mtime__'] == mtime_ns and cached['__src_size__'] == size:
+            return cached['config']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # missing, stale format or unreadable, parse the YAML instead
+    
+    with open(config_file, 'r', encoding='utf-8') as f:
+        config_data = yaml.safe_load(f) or {}
+    
+    if not _is_json_safe(config_data):
+        logger.debug(f"Not caching {path}: it holds values JSON can't represent")
+        return config_data
+    
+    # Best effort: a read-only config directory just means no cache
+    try:
+        payload = json.dumps({
+            '__src_mtime__': mtime_ns,
+            '__src_size__': size,
+            'config': config_data
+        })
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write configuration cache {cache_file}: {e}")
+    
+    return config_data
 
 @dataclass
 class GeneralConfig:
@@ -23,6 +88,8 @@ class GeneralConfig:
     log_level: str = "INFO"
     enable_ai: bool = True
     data_retention_days: int = 30
+    status_poll_ttl: float = 30.0  # seconds the GUI reuses disk and other slow status figures
+    max_fps: int = 60  # GUI animation frame rate cap
 
 
 @dataclass
@@ -43,6 +110,7 @@ class ScanningConfig:
     ])
     max_scan_depth: int = 10
     scan_timeout: int = 300  # seconds
+    hash_algo: str = "blake3"  # duplicate detection; any hashlib name also works
 
 
 @dataclass
@@ -165,8 +233,7 @@ class Config:
             return
         
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f) or {}
+            config_data = self._read_config_data(config_file)
             
             # Update configuration sections
             self._update_section(self.general, config_data.get('general', {}))
@@ -182,6 +249,13 @@ class Config:
             logger.error(f"Failed to load configuration: {e}")
             logger.info("Using default configuration")
     
+    def _read_config_data(self, config_file: Path) -> Dict[str, Any]:
+        """Parse the config file, reusing earlier parses while it is unchanged."""
+        path = os.path.abspath(config_file)
+        st = os.stat(path)
+        # Sections get the parsed lists directly, so hand out a private copy
+        return copy.deepcopy(_load_config_data(path, st.st_mtime_ns, st.st_size))
+    
     def _update_section(self, section: Any, data: Dict[str, Any]):
         """Update a configuration section with new data."""
         for key, value in data.items():
@@ -200,7 +274,9 @@ class Config:
                 'max_backup_size': '1GB',
                 'log_level': 'INFO',
                 'enable_ai': True,
-                'data_retention_days': 30
+                'data_retention_days': 30,
+                'status_poll_ttl': 30.0,
+                'max_fps': 60
             },
             'scanning': {
                 'include_system_caches': True,
@@ -217,7 +293,8 @@ class Config:
                     '*.bak'
                 ],
                 'max_scan_depth': 10,
-                'scan_timeout': 300
+                'scan_timeout': 300,
+                'hash_algo': 'blake3'
             },
             'cleaning': {
                 'browser_caches': True,
@@ -371,12 +448,18 @@ class Config:
         except AttributeError as e:
             logger.error(f"Failed to set configuration key '{key}': {e}")
     
-    def save(self, path: Optional[str] = None):
+    def save(self, path: Optional[str] = None) -> bool:
         """
         Save current configuration to file.
         
+        The file is written to a temporary path next to the target and
+        swapped into place, so a failed save never truncates the config.
+        
         Args:
             path: Optional custom path to save configuration
+            
+        Returns:
+            True if the configuration was written, False otherwise
         """
         save_path = path or self.config_path
         
@@ -393,12 +476,18 @@ class Config:
             save_dir = Path(save_path).parent
             save_dir.mkdir(parents=True, exist_ok=True)
             
-            with open(save_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_data, f, default_flow_style=False, indent=2)
+            # Serialize up front so the file sees a single write
+            data = yaml.dump(config_data, default_flow_style=False, indent=2)
+            tmp_path = f"{save_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8', buffering=CONFIG_WRITE_BUFFER) as f:
+                f.write(data)
+            os.replace(tmp_path, save_path)
             
             logger.info(f"Configuration saved to: {save_path}")
+            return True
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
+            return False
     
     def _section_to_dict(self, section: Any) -> Dict[str, Any]:
         """Convert a configuration section to dictionary."""
@@ -13,10 +13,15 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
 from .config import Config
 from ..scanners.system_scanner import SystemScanner
 from ..cleaners.cache_cleaner import CacheCleaner
-from ..optimizers.performance_optimizer import PerformanceOptimizer
+from ..optimizers.performance_optimizer import PerformanceOptimizer, OptimizeOptions, OptimizationResult
 from ..ai.intelligence_engine import IntelligenceEngine
 from ..utils.platform import detect_platform
 from ..utils.reporting import ReportGenerator
@@ -47,18 +52,6 @@ class CleanResult:
     backup_path: Optional[str] = None
 
 
-@dataclass
-class OptimizationResult:
-    """Results from system optimization operation."""
-    optimizations_applied: int = 0
-    performance_improvement: float = 0.0  # percentage
-    optimization_duration: float = 0.0
-    optimization_errors: List[str] = field(default_factory=list)
-    startup_items_optimized: int = 0
-    memory_optimized: bool = False
-    disk_optimized: bool = False
-
-
 class PurrifyEngine:
     """
     Main engine for Purrify system optimization utility.
@@ -91,6 +84,9 @@ class PurrifyEngine:
         self.last_clean_result: Optional[CleanResult] = None
         self.last_optimization_result: Optional[OptimizationResult] = None
         
+        # Shared rich console for the display_* methods, created on first use
+        self._console = None
+        
         logger.info("PurrifyEngine initialized successfully")
     
     async def scan_system(
@@ -237,14 +233,14 @@ class PurrifyEngine:
     
     async def optimize_system(
         self,
-        optimization_options: Dict[str, bool],
+        optimization_options: OptimizeOptions,
         safe_mode: bool = True
     ) -> OptimizationResult:
         """
         Optimize system performance.
         
         Args:
-            optimization_options: Dictionary specifying optimization types
+            optimization_options: Which optimizations to apply
             safe_mode: Enable safe mode (preview only)
             
         Returns:
@@ -306,6 +302,15 @@ class PurrifyEngine:
             logger.error(f"Failed to get system status: {e}")
             return {"error": str(e)}
     
+    async def get_resource_usage(self) -> Dict[str, Any]:
+        """
+        Get current CPU and memory usage, without the slower status probes.
+        
+        Returns:
+            Dictionary containing CPU and memory usage
+        """
+        return await self.scanner.get_resource_usage()
+    
     async def generate_report(self, detailed: bool = False) -> Dict[str, Any]:
         """
         Generate comprehensive system optimization report.
@@ -355,106 +360,96 @@ class PurrifyEngine:
     
     def display_scan_results(self, scan_result: ScanResult, output_file: Optional[str] = None):
         """Display enhanced scan results in a user-friendly format."""
-        from rich.console import Console
-        from rich.table import Table
         from rich.panel import Panel
         
-        console = Console()
+        console = self._get_console()
+        fmt = self._format_bytes
         
         # Create main results table
-        table = Table(title="🔍 Enhanced System Scan Results")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", style="green")
-        
-        table.add_row("Files Scanned", f"{scan_result.total_files_scanned:,}")
-        table.add_row("Cache Files", f"{scan_result.cache_files_found:,}")
-        table.add_row("Temp Files", f"{scan_result.temp_files_found:,}")
-        table.add_row("Log Files", f"{scan_result.log_files_found:,}")
-        table.add_row("Large Files", f"{scan_result.large_files_found:,}")
-        table.add_row("Potential Savings", self._format_bytes(scan_result.potential_space_savings))
-        table.add_row("Scan Duration", f"{scan_result.scan_duration:.2f}s")
-        
-        console.print(table)
+        console.print(self._metric_table("🔍 Enhanced System Scan Results", [
+            ("Files Scanned", f"{scan_result.total_files_scanned:,}"),
+            ("Cache Files", f"{scan_result.cache_files_found:,}"),
+            ("Temp Files", f"{scan_result.temp_files_found:,}"),
+            ("Log Files", f"{scan_result.log_files_found:,}"),
+            ("Large Files", f"{scan_result.large_files_found:,}"),
+            ("Potential Savings", fmt(scan_result.potential_space_savings)),
+            ("Scan Duration", f"{scan_result.scan_duration:.2f}s"),
+        ]))
         
         # Display enhanced results if available
-        if hasattr(scan_result, 'file_details') and scan_result.file_details:
+        details = scan_result.file_details
+        if details:
             # Duplicates section
-            duplicates = scan_result.file_details.get("duplicates", {})
-            if duplicates.get("groups", 0) > 0:
-                dup_table = Table(title="🔄 Duplicate Files Found")
-                dup_table.add_column("Metric", style="cyan")
-                dup_table.add_column("Value", style="green")
-                
-                dup_table.add_row("Duplicate Groups", f"{duplicates.get('groups', 0)}")
-                dup_table.add_row("Total Duplicate Size", self._format_bytes(duplicates.get('total_size', 0)))
-                dup_table.add_row("Potential Savings", self._format_bytes(duplicates.get('potential_savings', 0)))
-                
-                console.print(dup_table)
+            duplicates = details.get("duplicates", {})
+            groups = duplicates.get("groups", 0)
+            if groups > 0:
+                console.print(self._metric_table("🔄 Duplicate Files Found", [
+                    ("Duplicate Groups", f"{groups}"),
+                    ("Total Duplicate Size", fmt(duplicates.get('total_size', 0))),
+                    ("Potential Savings", fmt(duplicates.get('potential_savings', 0))),
+                ]))
                 
                 # Show some duplicate groups
-                if duplicates.get('groups_detail'):
+                groups_detail = duplicates.get('groups_detail')
+                if groups_detail:
+                    largest = groups_detail[0]
                     console.print(Panel(
-                        f"Found {len(duplicates['groups_detail'])} duplicate groups\n"
-                        f"Largest group: {duplicates['groups_detail'][0].get('count', 0)} files "
-                        f"({self._format_bytes(duplicates['groups_detail'][0].get('total_size', 0))})",
+                        f"Found {len(groups_detail)} duplicate groups\n"
+                        f"Largest group: {largest.get('count', 0)} files "
+                        f"({fmt(largest.get('total_size', 0))})",
                         title="📋 Duplicate Summary",
                         border_style="yellow"
                     ))
             
             # Photos section
-            photos = scan_result.file_details.get("photos", {})
-            if photos.get("count", 0) > 0:
-                photo_table = Table(title="📸 Photo Analysis")
-                photo_table.add_column("Metric", style="cyan")
-                photo_table.add_column("Value", style="green")
-                
-                photo_table.add_row("Photos Found", f"{photos.get('count', 0)}")
-                photo_table.add_row("Total Photo Size", self._format_bytes(photos.get('total_size', 0)))
-                photo_table.add_row("Potential Savings", self._format_bytes(photos.get('potential_savings', 0)))
-                
-                console.print(photo_table)
+            photos = details.get("photos", {})
+            photo_count = photos.get("count", 0)
+            if photo_count > 0:
+                photo_savings = photos.get('potential_savings', 0)
+                console.print(self._metric_table("📸 Photo Analysis", [
+                    ("Photos Found", f"{photo_count}"),
+                    ("Total Photo Size", fmt(photos.get('total_size', 0))),
+                    ("Potential Savings", fmt(photo_savings)),
+                ]))
                 
                 # Show photo optimization opportunities
-                if photos.get('photos_detail'):
+                photos_detail = photos.get('photos_detail')
+                if photos_detail:
                     console.print(Panel(
-                        f"Analyzed {len(photos['photos_detail'])} photos for optimization\n"
-                        f"Average compression potential: {photos.get('potential_savings', 0) / max(photos.get('count', 1), 1) / 1024 / 1024:.1f} MB per photo",
+                        f"Analyzed {len(photos_detail)} photos for optimization\n"
+                        f"Average compression potential: {photo_savings / photo_count / 1024 / 1024:.1f} MB per photo",
                         title="🎨 Photo Optimization",
                         border_style="magenta"
                     ))
             
             # Large files section
-            large_files = scan_result.file_details.get("large_files", {})
-            if large_files.get("count", 0) > 0:
-                large_table = Table(title="📁 Large Files")
-                large_table.add_column("Metric", style="cyan")
-                large_table.add_column("Value", style="green")
-                
-                large_table.add_row("Large Files Found", f"{large_files.get('count', 0)}")
-                large_table.add_row("Total Large File Size", self._format_bytes(large_files.get('total_size', 0)))
-                
-                console.print(large_table)
+            large_files = details.get("large_files", {})
+            large_count = large_files.get("count", 0)
+            if large_count > 0:
+                console.print(self._metric_table("📁 Large Files", [
+                    ("Large Files Found", f"{large_count}"),
+                    ("Total Large File Size", fmt(large_files.get('total_size', 0))),
+                ]))
                 
                 # Show some large files
-                if large_files.get('files'):
+                files = large_files.get('files')
+                if files:
+                    largest = files[0]
                     console.print(Panel(
-                        f"Largest file: {self._format_bytes(large_files['files'][0].get('size', 0))}\n"
-                        f"File type: {large_files['files'][0].get('file_type', 'Unknown')}",
+                        f"Largest file: {fmt(largest.get('size', 0))}\n"
+                        f"File type: {largest.get('file_type', 'Unknown')}",
                         title="📋 Large File Summary",
                         border_style="red"
                     ))
             
             # Old files section
-            old_files = scan_result.file_details.get("old_files", {})
-            if old_files.get("count", 0) > 0:
-                old_table = Table(title="📅 Old Files")
-                old_table.add_column("Metric", style="cyan")
-                old_table.add_column("Value", style="green")
-                
-                old_table.add_row("Old Files Found", f"{old_files.get('count', 0)}")
-                old_table.add_row("Total Old File Size", self._format_bytes(old_files.get('total_size', 0)))
-                
-                console.print(old_table)
+            old_files = details.get("old_files", {})
+            old_count = old_files.get("count", 0)
+            if old_count > 0:
+                console.print(self._metric_table("📅 Old Files", [
+                    ("Old Files Found", f"{old_count}"),
+                    ("Total Old File Size", fmt(old_files.get('total_size', 0))),
+                ]))
         
         # Display errors if any
         if scan_result.scan_errors:
@@ -471,11 +466,10 @@ class PurrifyEngine:
     
     def display_clean_results(self, clean_result: CleanResult):
         """Display cleaning results in a user-friendly format."""
-        from rich.console import Console
         from rich.table import Table
         from rich.panel import Panel
         
-        console = Console()
+        console = self._get_console()
         
         # Create results table
         table = Table(title="🧹 System Cleaning Results")
@@ -503,11 +497,10 @@ class PurrifyEngine:
     
     def display_optimization_results(self, opt_result: OptimizationResult):
         """Display optimization results in a user-friendly format."""
-        from rich.console import Console
         from rich.table import Table
         from rich.panel import Panel
         
-        console = Console()
+        console = self._get_console()
         
         # Create results table
         table = Table(title="⚡ System Optimization Results")
@@ -534,11 +527,10 @@ class PurrifyEngine:
     
     def display_system_status(self, status_info: Dict[str, Any]):
         """Display system status in a user-friendly format."""
-        from rich.console import Console
         from rich.table import Table
         from rich.panel import Panel
         
-        console = Console()
+        console = self._get_console()
         
         # Create status table
         table = Table(title="📈 System Status")
@@ -568,11 +560,10 @@ class PurrifyEngine:
     
     def display_report(self, report_data: Dict[str, Any], output_file: Optional[str] = None):
         """Display comprehensive system report."""
-        from rich.console import Console
         from rich.panel import Panel
         from rich.markdown import Markdown
         
-        console = Console()
+        console = self._get_console()
         
         # Display report content
         if "markdown" in report_data:
@@ -585,6 +576,24 @@ class PurrifyEngine:
         if output_file:
             self._save_report_to_file(report_data, output_file)
     
+    def _get_console(self):
+        """Return the engine's rich console, creating it on first use."""
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return self._console
+    
+    def _metric_table(self, title: str, rows: List[Tuple[str, str]]):
+        """Build a two-column Metric/Value table from pre-formatted rows."""
+        from rich.table import Table
+        
+        table = Table(title=title)
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", style="green")
+        for metric, value in rows:
+            table.add_row(metric, value)
+        return table
+    
     def _format_bytes(self, bytes_value: int) -> str:
         """Format bytes into human-readable string."""
         if bytes_value == 0:
@@ -601,9 +610,7 @@ class PurrifyEngine:
     def _save_results_to_file(self, results: Any, output_file: str):
         """Save results to file."""
         try:
-            import json
-            with open(output_file, 'w') as f:
-                json.dump(results.__dict__, f, indent=2, default=str)
+            self._dump_json(results.__dict__, output_file)
             logger.info(f"Results saved to: {output_file}")
         except Exception as e:
             logger.error(f"Failed to save results: {e}")
@@ -615,9 +622,27 @@ class PurrifyEngine:
                 with open(output_file, 'w') as f:
                     f.write(report_data.get('markdown', str(report_data)))
             else:
-                import json
-                with open(output_file, 'w') as f:
-                    json.dump(report_data, f, indent=2, default=str)
+                self._dump_json(report_data, output_file)
             logger.info(f"Report saved to: {output_file}")
         except Exception as e:
-            logger.error(f"Failed to save report: {e}") 
\ No newline at end of file
+            logger.error(f"Failed to save report: {e}")
+    
+    def _dump_json(self, data: Dict[str, Any], output_file: str):
+        """
+        Write data as indented JSON.
+        
+        Uses orjson when installed, which serializes straight to UTF-8
+        bytes in C instead of building the document through Python str
+        chunks; otherwise falls back to the stdlib json module.
+        """
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            import json
+            with open(output_file, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
\ No newline at end of file
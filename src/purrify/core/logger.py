@@ -7,15 +7,187 @@ system optimization utility with structured logging and different log levels.
 
 import sys
 import os
+import functools
+import socket
+import time
+import traceback
+import zipfile
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # optional, structured logs fall back to loguru's serializer
+    orjson = None
+
+# Static context attached to every structured record
+_HOSTNAME = socket.gethostname()
+_PID = os.getpid()
+
+# Numeric values of loguru's built-in levels
+_LEVEL_NO = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50
+}
+
+# Lowest level accepted by any configured sink; records below it are
+# dropped before their message or context is built. loguru's default
+# stderr sink accepts everything until setup_logger runs.
+_MIN_LEVEL_NO = 0
+
+# Write buffer for the main log file; records are flushed in blocks
+# rather than with one write() per message
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Shared empty mapping unpacked when a structured call has no extras
+_NO_EXTRA = {}
+
+# Level used by log_operation for each operation status
+_STATUS_LEVELS = {
+    "completed": "SUCCESS",
+    "failed": "ERROR"
+}
+
+
+class _RotatingFileSink:
+    """
+    Buffered file sink that rotates by size without stat'ing the file.
+    
+    loguru's ``rotation="10 MB"`` checks the file size on every record;
+    this sink counts the bytes it writes instead and only touches the
+    filesystem when the limit is reached. Rotated files are renamed with
+    a timestamp, zipped, and pruned after ``retention_days``.
+    
+    It deliberately has no ``flush`` method, so loguru doesn't flush after
+    every record; the buffer is flushed after each ERROR or higher record
+    and when loguru calls ``stop``. Pass ``buffering=0`` for files whose
+    records must all reach disk at once.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int,
+        retention_days: int,
+        buffering: int = LOG_BUFFER_SIZE
+    ):
+        self._path = path
+        self._max_bytes = max_bytes
+        self._retention = retention_days * 24 * 3600
+        self._buffering = buffering
+        self._open()
+    
+    def _open(self):
+        self._file = open(self._path, "ab", buffering=self._buffering)
+        self._size = self._file.tell()
+    
+    def write(self, message):
+        self._write_bytes(str(message).encode("utf-8"), message.record)
+    
+    def _write_bytes(self, data: bytes, record):
+        if self._size and self._size + len(data) > self._max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._size += len(data)
+        
+        # Errors must not sit in the buffer if the process dies
+        if record["level"].no >= _LEVEL_NO["ERROR"]:
+            self._file.flush()
+    
+    def _rotate(self):
+        self._file.close()
+        
+        root, ext = os.path.splitext(self._path)
+        rotated = f"{root}.{datetime.now():%Y-%m-%d_%H-%M-%S_%f}{ext}"
+        os.replace(self._path, rotated)
+        with zipfile.ZipFile(f"{rotated}.zip", "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.write(rotated, arcname=os.path.basename(rotated))
+        os.remove(rotated)
+        
+        # Drop archives older than the retention period
+        cutoff = time.time() - self._retention
+        for archive_path in Path(self._path).parent.glob(f"{Path(root).name}.*{ext}.zip"):
+            try:
+                if archive_path.stat().st_mtime < cutoff:
+                    archive_path.unlink()
+            except OSError:
+                pass
+        
+        self._open()
+    
+    def stop(self):
+        self._file.close()
+
+
+class _LazyFileSink:
+    """
+    Sink that creates its file sink on the first record it receives.
+    
+    Used for the error log: processes that never log an error never open
+    (or rotate) the file.
+    """
+    
+    def __init__(self, factory):
+        self._factory = factory
+        self._sink = None
+    
+    def write(self, message):
+        if self._sink is None:
+            self._sink = self._factory()
+        self._sink.write(message)
+    
+    def stop(self):
+        if self._sink is not None:
+            self._sink.stop()
+
+
+class _JsonLinesSink(_RotatingFileSink):
+    """
+    Rotating file sink writing one compact orjson object per record.
+    
+    Bound and per-call fields are nested under ``"x"`` so they can never
+    overwrite the fixed keys. Tracebacks arrive pre-rendered in
+    ``extra["exc"]`` (see ``_render_exception``), since enqueued records
+    lose their frames.
+    """
+    
+    def write(self, message):
+        record = message.record
+        data = {
+            "t": record["time"].timestamp(),
+            "l": record["level"].no,
+            "n": record["name"],
+            "m": record["message"],
+            "x": record["extra"]
+        }
+        self._write_bytes(orjson.dumps(data, default=str) + b"\n", record)
+
+
+def _render_exception(record):
+    """
+    Format a record's traceback into ``extra["exc"]``.
+    
+    Runs as a patcher in the logging thread: enqueued records are pickled
+    for the writer thread, which drops the traceback's frames.
+    """
+    if record["exception"] is not None:
+        record["extra"]["exc"] = "".join(traceback.format_exception(*record["exception"]))
+
 
 def setup_logger(
     verbose: bool = False,
     log_file: Optional[str] = None,
-    log_level: str = "INFO"
+    log_level: str = "INFO",
+    enable_error_log: bool = True,
+    structured: bool = False,
+    file_level: str = "DEBUG"
 ) -> None:
     """
     Setup logging configuration for Purrify.
@@ -24,7 +196,15 @@ def setup_logger(
         verbose: Enable verbose logging
         log_file: Path to log file (optional)
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        enable_error_log: Also write ERROR and above to a separate
+            purrify_errors.log next to the main log file; the file is
+            only opened once the first error is logged
+        structured: Write the main log file as JSON lines instead of text
+        file_level: Lowest level written to the main log file; raise it
+            so disabled levels are skipped before their records are built
     """
+    global _MIN_LEVEL_NO
+    
     # Remove default logger
     logger.remove()
     
@@ -68,41 +248,75 @@ def setup_logger(
         diagnose=True
     )
     
-    # Add file handler
-    logger.add(
-        log_file,
-        format=file_format,
-        level="DEBUG",  # Always log everything to file
-        rotation="10 MB",
-        retention="30 days",
-        compression="zip",
-        backtrace=True,
-        diagnose=True
-    )
+    # Add file handler; writes happen on loguru's background queue
+    # thread through a block-buffered file
+    use_json_sink = structured and orjson is not None
+    logger.configure(patcher=_render_exception if use_json_sink else None)
+    if use_json_sink:
+        logger.add(
+            _JsonLinesSink(log_file, max_bytes=10 * 1024 * 1024, retention_days=30),
+            format="{message}",
+            level=file_level,
+            enqueue=True
+        )
+    else:
+        logger.add(
+            _RotatingFileSink(log_file, max_bytes=10 * 1024 * 1024, retention_days=30),
+            format=file_format,
+            level=file_level,
+            # Extended tracebacks with variable values are costly; they are
+            # kept on the console and the optional error log only
+            backtrace=False,
+            diagnose=False,
+            enqueue=True,
+            serialize=structured
+        )
     
     # Add error file handler
-    error_log_file = str(Path(log_file).parent / "purrify_errors.log")
-    logger.add(
-        error_log_file,
-        format=file_format,
-        level="ERROR",
-        rotation="5 MB",
-        retention="90 days",
-        compression="zip",
-        backtrace=True,
-        diagnose=True
-    )
+    error_log_file = None
+    if enable_error_log:
+        error_log_file = str(Path(log_file).parent / "purrify_errors.log")
+        logger.add(
+            # Unbuffered, so error records reach disk immediately; errors
+            # are rare, so they are written inline rather than through
+            # another queue thread
+            _LazyFileSink(functools.partial(
+                _RotatingFileSink,
+                error_log_file,
+                max_bytes=5 * 1024 * 1024,
+                retention_days=90,
+                buffering=0
+            )),
+            format=file_format,
+            level="ERROR",
+            backtrace=True,
+            diagnose=True
+        )
+    
+    # Lowest level any installed sink accepts
+    sink_levels = [log_level, file_level] + (["ERROR"] if enable_error_log else [])
+    _MIN_LEVEL_NO = min(logger.level(level).no for level in sink_levels)
     
     logger.info("Logging system initialized")
     logger.info(f"Log level: {log_level}")
     logger.info(f"Log file: {log_file}")
-    logger.info(f"Error log file: {error_log_file}")
+    if error_log_file:
+        logger.info(f"Error log file: {error_log_file}")
+
 
+def _deferred(data: dict) -> dict:
+    """Wrap each value of ``data`` in a callable for ``logger.opt(lazy=True)``."""
+    return {key: (lambda value=value: value) for key, value in data.items()}
 
+
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str = "purrify"):
     """
     Get a logger instance with the specified name.
     
+    Bound loggers are immutable and share loguru's handlers, so one
+    instance per name is cached and reused.
+    
     Args:
         name: Logger name
         
@@ -117,6 +331,8 @@ class PurrifyLogger:
     Custom logger class for Purrify with additional functionality.
     """
     
+    __slots__ = ("logger", "name", "_base_ctx", "_lazy")
+    
     def __init__(self, name: str = "purrify"):
         """
         Initialize the Purrify logger.
@@ -126,35 +342,59 @@ class PurrifyLogger:
         """
         self.logger = get_logger(name)
         self.name = name
+        self._base_ctx = {"logger": name, "host": _HOSTNAME, "pid": _PID}
+        
+        # Lazy view used by the structured helpers, with the static context
+        # bound once: message arguments and per-call values are callables,
+        # evaluated only if a sink takes the record
+        self._lazy = self.logger.bind(**self._base_ctx).opt(lazy=True)
     
     def debug(self, message: str, **kwargs):
         """Log debug message."""
+        if _LEVEL_NO["DEBUG"] < _MIN_LEVEL_NO:
+            return
         self.logger.debug(message, **kwargs)
     
     def info(self, message: str, **kwargs):
         """Log info message."""
+        if _LEVEL_NO["INFO"] < _MIN_LEVEL_NO:
+            return
         self.logger.info(message, **kwargs)
     
     def warning(self, message: str, **kwargs):
         """Log warning message."""
+        if _LEVEL_NO["WARNING"] < _MIN_LEVEL_NO:
+            return
         self.logger.warning(message, **kwargs)
     
     def error(self, message: str, **kwargs):
         """Log error message."""
+        if _LEVEL_NO["ERROR"] < _MIN_LEVEL_NO:
+            return
         self.logger.error(message, **kwargs)
     
     def critical(self, message: str, **kwargs):
         """Log critical message."""
+        if _LEVEL_NO["CRITICAL"] < _MIN_LEVEL_NO:
+            return
         self.logger.critical(message, **kwargs)
     
     def success(self, message: str, **kwargs):
         """Log success message."""
+        if _LEVEL_NO["SUCCESS"] < _MIN_LEVEL_NO:
+            return
         self.logger.success(message, **kwargs)
     
     def exception(self, message: str, **kwargs):
         """Log exception with traceback."""
+        if _LEVEL_NO["ERROR"] < _MIN_LEVEL_NO:
+            return
         self.logger.exception(message, **kwargs)
     
+    def _should_log(self, level: str) -> bool:
+        """Return whether a record at ``level`` would reach any sink."""
+        return _LEVEL_NO.get(level, 0) >= _MIN_LEVEL_NO
+    
     def bind(self, **kwargs):
         """Bind additional context to logger."""
         return self.logger.bind(**kwargs)
@@ -168,23 +408,18 @@ class PurrifyLogger:
             status: Operation status (started, completed, failed)
             details: Additional operation details
         """
-        log_data = {
-            "operation": operation,
-            "status": status,
-            "logger": self.name
-        }
+        if not self._should_log(_STATUS_LEVELS.get(status, "INFO")):
+            return
         
-        if details:
-            log_data.update(details)
-        
-        if status == "started":
-            self.info(f"Operation started: {operation}", **log_data)
-        elif status == "completed":
-            self.success(f"Operation completed: {operation}", **log_data)
-        elif status == "failed":
-            self.error(f"Operation failed: {operation}", **log_data)
-        else:
-            self.info(f"Operation {status}: {operation}", **log_data)
+        self._lazy.log(
+            _STATUS_LEVELS.get(status, "INFO"),
+            "Operation {}: {}",
+            lambda: status,
+            lambda: operation,
+            operation=lambda: operation,
+            status=lambda: status,
+            **(_deferred(details) if details else _NO_EXTRA)
+        )
     
     def log_performance(self, operation: str, duration: float, metrics: dict = None):
         """
@@ -195,16 +430,17 @@ class PurrifyLogger:
             duration: Operation duration in seconds
             metrics: Additional performance metrics
         """
-        log_data = {
-            "operation": operation,
-            "duration": duration,
-            "logger": self.name
-        }
+        if not self._should_log("INFO"):
+            return
         
-        if metrics:
-            log_data.update(metrics)
-        
-        self.info(f"Performance: {operation} took {duration:.2f}s", **log_data)
+        self._lazy.info(
+            "Performance: {} took {:.2f}s",
+            lambda: operation,
+            lambda: duration,
+            operation=lambda: operation,
+            duration=lambda: duration,
+            **(_deferred(metrics) if metrics else _NO_EXTRA)
+        )
     
     def log_system_event(self, event_type: str, description: str, data: dict = None):
         """
@@ -215,16 +451,17 @@ class PurrifyLogger:
             description: Event description
             data: Additional event data
         """
-        log_data = {
-            "event_type": event_type,
-            "description": description,
-            "logger": self.name
-        }
-        
-        if data:
-            log_data.update(data)
+        if not self._should_log("INFO"):
+            return
         
-        self.info(f"System event: {event_type} - {description}", **log_data)
+        self._lazy.info(
+            "System event: {} - {}",
+            lambda: event_type,
+            lambda: description,
+            event_type=lambda: event_type,
+            description=lambda: description,
+            **(_deferred(data) if data else _NO_EXTRA)
+        )
 
 
 # Global logger instance
@@ -241,18 +478,18 @@ def log_function_call(func):
     Returns:
         Decorated function
     """
+    func_logger = PurrifyLogger(f"{func.__module__}.{func.__name__}")
+    
     def wrapper(*args, **kwargs):
-        logger_name = f"{func.__module__}.{func.__name__}"
-        func_logger = PurrifyLogger(logger_name)
-        
-        func_logger.log_operation(
-            operation=func.__name__,
-            status="started",
-            details={
-                "args_count": len(args),
-                "kwargs_count": len(kwargs)
-            }
-        )
+        if func_logger._should_log("INFO"):
+            func_logger.log_operation(
+                operation=func.__name__,
+                status="started",
+                details={
+                    "args_count": len(args),
+                    "kwargs_count": len(kwargs)
+                }
+            )
         
         try:
             result = func(*args, **kwargs)
@@ -282,55 +519,52 @@ def log_async_function_call(func):
     Returns:
         Decorated async function
     """
+    func_logger = PurrifyLogger(f"{func.__module__}.{func.__name__}")
+    
     async def wrapper(*args, **kwargs):
-        logger_name = f"{func.__module__}.{func.__name__}"
-        func_logger = PurrifyLogger(logger_name)
+        # Performance records are INFO; don't time calls nobody will see
+        timed = func_logger._should_log("INFO")
         
-        func_logger.log_operation(
-            operation=func.__name__,
-            status="started",
-            details={
-                "args_count": len(args),
-                "kwargs_count": len(kwargs),
-                "async": True
-            }
-        )
+        if timed:
+            func_logger.log_operation(
+                operation=func.__name__,
+                status="started",
+                details={
+                    "args_count": len(args),
+                    "kwargs_count": len(kwargs),
+                    "async": True
+                }
+            )
         
-        start_time = time.time()
+        start_time = time.perf_counter() if timed else 0.0
         
         try:
             result = await func(*args, **kwargs)
-            duration = time.time() - start_time
-            
             func_logger.log_operation(
                 operation=func.__name__,
                 status="completed"
             )
             
-            func_logger.log_performance(
-                operation=func.__name__,
-                duration=duration
-            )
+            if timed:
+                func_logger.log_performance(
+                    operation=func.__name__,
+                    duration=time.perf_counter() - start_time
+                )
             
             return result
         except Exception as e:
-            duration = time.time() - start_time
-            
             func_logger.log_operation(
                 operation=func.__name__,
                 status="failed",
                 details={"error": str(e)}
             )
             
-            func_logger.log_performance(
-                operation=func.__name__,
-                duration=duration
-            )
+            if timed:
+                func_logger.log_performance(
+                    operation=func.__name__,
+                    duration=time.perf_counter() - start_time
+                )
             
             raise
     
     return wrapper
-
-
-# Import time module for async decorator
-import time 
\ No newline at end of file
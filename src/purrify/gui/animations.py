@@ -6,12 +6,104 @@ Aphrodite's cleansing waters and graceful movements.
 """
 
 import tkinter as tk
+import functools
 import math
 import time
-import threading
 import random
-from typing import Callable, Optional, List
+from dataclasses import dataclass, field
+from typing import List, Sequence, Tuple
 from .styles import AphroditeTheme
+from ..utils.compat import DATACLASS_SLOTS
+
+try:
+    from PIL import Image, ImageTk
+except ImportError:  # optional, the gradient falls back to canvas lines
+    Image = ImageTk = None
+
+# Interval of the shared animation tick (~60 FPS)
+FRAME_MS = 16
+
+@functools.lru_cache(maxsize=64)
+def _hex_to_rgb(color: str) -> Tuple[int, int, int]:
+    """Parse a ``#rrggbb`` color into integer RGB components."""
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+@functools.lru_cache(maxsize=4096)
+def _adjust_color_alpha(color: str, alpha: int) -> str:
+    """Adjust color alpha for transparency effects."""
+    r, g, b = _hex_to_rgb(color)
+    
+    # Apply alpha
+    return f"#{r * alpha // 255:02x}{g * alpha // 255:02x}{b * alpha // 255:02x}"
+
+@functools.lru_cache(maxsize=4096)
+def _blend_colors(color1: str, color2: str, factor: float) -> str:
+    """Blend two colors with a factor."""
+    r1, g1, b1 = _hex_to_rgb(color1)
+    r2, g2, b2 = _hex_to_rgb(color2)
+    
+    # Blend
+    r = int(r1 * (1 - factor) + r2 * factor)
+    g = int(g1 * (1 - factor) + g2 * factor)
+    b = int(b1 * (1 - factor) + b2 * factor)
+    
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+class WaterParticles:
+    """Water particle state stored column-wise, one list per attribute."""
+    
+    __slots__ = ("x", "y", "vx", "vy", "size", "color", "item")
+    
+    def __init__(self):
+        self.clear()
+    
+    def clear(self):
+        """Remove all particles."""
+        self.x: List[float] = []
+        self.y: List[float] = []
+        self.vx: List[float] = []
+        self.vy: List[float] = []
+        self.size: List[float] = []
+        self.color: List[str] = []
+        self.item: List[int] = []
+    
+    def __len__(self) -> int:
+        return len(self.x)
+    
+    def add(self, x: float, y: float, vx: float, vy: float, size: float, color: str, item: int):
+        """Append a particle drawn by canvas item ``item``."""
+        self.x.append(x)
+        self.y.append(y)
+        self.vx.append(vx)
+        self.vy.append(vy)
+        self.size.append(size)
+        self.color.append(color)
+        self.item.append(item)
+
+@dataclass(**DATACLASS_SLOTS)
+class Wave:
+    """A cleansing wave drawn by canvas line ``item``."""
+    x: float
+    y: float
+    amplitude: float
+    frequency: float
+    phase: float
+    color: str
+    width: int
+    item: int = 0
+    fx: List[float] = field(default_factory=list)  # frequency * x per sample
+
+@dataclass(**DATACLASS_SLOTS)
+class Ripple:
+    """An expanding ripple drawn by canvas oval ``item``."""
+    x: float
+    y: float
+    color: str
+    item: int
+    radius: float = 0
+    max_radius: float = 100
+    alpha: float = 1.0
+    speed: float = 2
 
 class FluidAnimations:
     """Beautiful fluid animations for the Purrify interface."""
@@ -21,44 +113,66 @@ class FluidAnimations:
         self.theme = theme
         self.colors = theme.colors
         self.animation_running = False
-        self.particles = []
-        self.waves = []
-        self.ripples = []
+        self.particles = WaterParticles()
+        self.waves: List[Wave] = []
+        self.ripples: List[Ripple] = []
+        self._gradient_lines: List[int] = []
+        self._gradient_size = (0, 0)
+        self._gradient_lut: List[str] = []
+        self._gradient_offset = 0
+        self._gradient_clock = 0.0
+        self._gradient_strip = None
+        self._gradient_photo = None
+        
+        # Wave sample x positions, rebuilt when the canvas width changes
+        self._wave_xs: List[int] = []
+        self._wave_width = None
+        
+        # Shared frame driver; runs only while something is animating
+        self._tick_running = False
+        self._last_tick = 0.0
+        self.frame_ms = FRAME_MS
     
     def start_water_flow(self, duration: float = 3.0):
         """Start a beautiful water flow animation."""
         self.animation_running = True
         self._create_water_particles()
-        self._animate_water_flow(duration)
+        self._start_ticking()
     
     def start_cleansing_waves(self, duration: float = 2.0):
         """Start cleansing wave animations."""
         self.animation_running = True
         self._create_cleansing_waves()
-        self._animate_waves(duration)
+        self._start_ticking()
     
     def start_ripple_effect(self, x: int, y: int, color: str = None):
         """Start a ripple effect from a specific point."""
         if color is None:
             color = self.colors.primary_azure
         
-        ripple = {
-            'x': x,
-            'y': y,
-            'radius': 0,
-            'max_radius': 100,
-            'color': color,
-            'alpha': 1.0,
-            'speed': 2
-        }
+        ripple = Ripple(
+            x=x,
+            y=y,
+            color=color,
+            item=self.canvas.create_oval(
+                x, y, x, y,
+                outline=color,
+                width=2,
+                tags=("ripples", "animation")
+            )
+        )
         self.ripples.append(ripple)
-        self._animate_ripples()
+        self._start_ticking()
     
     def start_gradient_flow(self, duration: float = 4.0):
         """Start a flowing gradient animation."""
         self.animation_running = True
         gradient_colors = self.theme.get_gradient_colors()
-        self._animate_gradient(gradient_colors, duration)
+        self._gradient_lut = self._build_gradient_lut(gradient_colors)
+        self._gradient_offset = 0
+        self._gradient_clock = 0.0
+        self._gradient_size = (0, 0)
+        self._start_ticking()
     
     def stop_animations(self):
         """Stop all running animations."""
@@ -66,194 +180,265 @@ class FluidAnimations:
         self.particles.clear()
         self.waves.clear()
         self.ripples.clear()
+        self._gradient_lines.clear()
+        self._gradient_lut = []
+        self._gradient_strip = self._gradient_photo = None
         self.canvas.delete("animation")
     
+    def _start_ticking(self):
+        """Start the shared frame driver if it isn't running yet."""
+        if not self._tick_running:
+            self._tick_running = True
+            self._last_tick = time.perf_counter()
+            self.canvas.after(self.frame_ms, self._tick)
+    
+    def set_max_fps(self, max_fps: int):
+        """Cap the shared tick at ``max_fps`` frames per second."""
+        self.frame_ms = max(1, round(1000 / max(1, max_fps)))
+    
+    def _has_active_animations(self) -> bool:
+        """Return whether any animation still needs frames."""
+        if self.ripples:
+            return True
+        return self.animation_running and bool(self.particles or self.waves or self._gradient_lut)
+    
+    def _tick(self):
+        """
+        Advance every active animation by one frame.
+        
+        All animations share this single ``after`` callback, and the
+        canvas size is read once per frame for all of them. Each step
+        scales its motion by the elapsed time, so speeds match the old
+        per-animation frame intervals.
+        """
+        # Go idle, with no pending callback, once nothing is left to draw
+        if not self._has_active_animations():
+            self._tick_running = False
+            return
+        
+        now = time.perf_counter()
+        dt = min(now - self._last_tick, 0.1)
+        self._last_tick = now
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        
+        if self.animation_running:
+            if self.particles:
+                self._step_water_flow(dt, canvas_width, canvas_height)
+            if self.waves:
+                self._step_waves(dt, canvas_width)
+            if self._gradient_lut:
+                self._step_gradient(dt, canvas_width, canvas_height)
+        if self.ripples:
+            self._step_ripples(dt)
+        
+        # Schedule next frame, counting the time this one took
+        elapsed_ms = int((time.perf_counter() - now) * 1000)
+        self.canvas.after(max(1, self.frame_ms - elapsed_ms), self._tick)
+    
     def _create_water_particles(self):
         """Create water particles for flow animation."""
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         
         for _ in range(20):
-            particle = {
-                'x': 0,
-                'y': canvas_height * 0.2 + random.random() * canvas_height * 0.6,
-                'vx': 1 + random.random() * 2,
-                'vy': -0.5 + random.random() * 1,
-                'size': 2 + random.random() * 4,
-                'alpha': 0.3 + random.random() * 0.7,
-                'color': self.colors.primary_azure
-            }
-            self.particles.append(particle)
+            # Particle alpha never changes, so its faded color is fixed too
+            alpha = 0.3 + random.random() * 0.7
+            color = _adjust_color_alpha(self.colors.primary_azure, int(alpha * 255))
+            self.particles.add(
+                x=0,
+                y=canvas_height * 0.2 + random.random() * canvas_height * 0.6,
+                vx=1 + random.random() * 2,
+                vy=-0.5 + random.random() * 1,
+                size=2 + random.random() * 4,
+                color=color,
+                item=self.canvas.create_oval(
+                    0, 0, 0, 0,
+                    fill=color,
+                    outline="",
+                    tags=("water_particles", "animation")
+                )
+            )
     
-    def _animate_water_flow(self, duration: float):
-        """Animate water particles flowing across the canvas."""
-        if not self.animation_running:
-            return
+    def _step_water_flow(self, dt: float, canvas_width: int, canvas_height: int):
+        """Move water particles across the canvas."""
+        # Velocities are in pixels per 50 ms
+        scale = dt * 20
         
-        self.canvas.delete("water_particles")
-        canvas_width = self.canvas.winfo_width()
+        # Update all positions column-wise
+        particles = self.particles
+        particles.x = [x + vx * scale for x, vx in zip(particles.x, particles.vx)]
+        particles.y = [y + vy * scale for y, vy in zip(particles.y, particles.vy)]
         
-        for particle in self.particles:
-            # Update position
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            
-            # Wrap around if off screen
-            if particle['x'] > canvas_width:
-                particle['x'] = -10
-                particle['y'] = self.canvas.winfo_height() * 0.2 + random.random() * self.canvas.winfo_height() * 0.6
-            
-            # Draw particle
-            alpha = int(particle['alpha'] * 255)
-            color = self._adjust_color_alpha(particle['color'], alpha)
-            
-            self.canvas.create_oval(
-                particle['x'] - particle['size'],
-                particle['y'] - particle['size'],
-                particle['x'] + particle['size'],
-                particle['y'] + particle['size'],
-                fill=color,
-                outline="",
-                tags="water_particles"
-            )
+        # Wrap around if off screen
+        for i, x in enumerate(particles.x):
+            if x > canvas_width:
+                particles.x[i] = -10
+                particles.y[i] = canvas_height * 0.2 + random.random() * canvas_height * 0.6
         
-        # Schedule next frame
-        self.canvas.after(50, lambda: self._animate_water_flow(duration))
+        # Move the particles' existing canvas items
+        for item, x, y, size in zip(particles.item, particles.x, particles.y, particles.size):
+            self.canvas.coords(item, x - size, y - size, x + size, y + size)
     
     def _create_cleansing_waves(self):
         """Create cleansing wave animations."""
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
+        self._wave_width = None
         
         for i in range(3):
-            wave = {
-                'x': canvas_width * 0.1,
-                'y': canvas_height * 0.3 + i * canvas_height * 0.2,
-                'amplitude': 20 + i * 10,
-                'frequency': 0.02 + i * 0.01,
-                'phase': i * math.pi / 3,
-                'color': self.colors.primary_rose,
-                'width': 3 + i * 2
-            }
+            wave = Wave(
+                x=canvas_width * 0.1,
+                y=canvas_height * 0.3 + i * canvas_height * 0.2,
+                amplitude=20 + i * 10,
+                frequency=0.02 + i * 0.01,
+                phase=i * math.pi / 3,
+                color=self.colors.primary_rose,
+                width=3 + i * 2
+            )
+            wave.item = self.canvas.create_line(
+                0, 0, 0, 0,
+                fill=wave.color,
+                width=wave.width,
+                smooth=True,
+                tags=("waves", "animation")
+            )
             self.waves.append(wave)
     
-    def _animate_waves(self, duration: float):
-        """Animate cleansing waves."""
-        if not self.animation_running:
-            return
-        
-        self.canvas.delete("waves")
-        canvas_width = self.canvas.winfo_width()
+    def _step_waves(self, dt: float, canvas_width: int):
+        """Advance cleansing waves."""
+        # Sample positions and each wave's frequency * x only depend on the width
+        if self._wave_width != canvas_width:
+            self._wave_xs = list(range(0, int(canvas_width * 0.8), 5))
+            for wave in self.waves:
+                wave.fx = [wave.frequency * x for x in self._wave_xs]
+            self._wave_width = canvas_width
         
+        sin = math.sin
         for wave in self.waves:
-            points = []
-            for x in range(0, int(canvas_width * 0.8), 5):
-                y = wave['y'] + wave['amplitude'] * math.sin(
-                    wave['frequency'] * x + wave['phase']
-                )
-                points.extend([x, y])
+            y0, amplitude, phase = wave.y, wave.amplitude, wave.phase
+            points = [
+                value
+                for x, fx in zip(self._wave_xs, wave.fx)
+                for value in (x, y0 + amplitude * sin(fx + phase))
+            ]
             
             if len(points) >= 4:
-                self.canvas.create_line(
-                    points,
-                    fill=wave['color'],
-                    width=wave['width'],
-                    smooth=True,
-                    tags="waves"
-                )
+                self.canvas.coords(wave.item, points)
             
-            wave['phase'] += 0.1
-        
-        # Schedule next frame
-        self.canvas.after(50, lambda: self._animate_waves(duration))
+            wave.phase += 2.0 * dt  # 0.1 rad per 50 ms
     
-    def _animate_ripples(self):
-        """Animate ripple effects."""
-        if not self.ripples:
-            return
-        
-        self.canvas.delete("ripples")
+    def _step_ripples(self, dt: float):
+        """Expand and fade ripple effects."""
+        # Speeds and fade rates are per 30 ms
+        scale = dt / 0.03
         
         for ripple in self.ripples[:]:
             # Update ripple
-            ripple['radius'] += ripple['speed']
-            ripple['alpha'] -= 0.02
+            ripple.radius += ripple.speed * scale
+            ripple.alpha -= 0.02 * scale
             
-            if ripple['alpha'] <= 0 or ripple['radius'] > ripple['max_radius']:
+            if ripple.alpha <= 0 or ripple.radius > ripple.max_radius:
+                self.canvas.delete(ripple.item)
                 self.ripples.remove(ripple)
                 continue
             
             # Draw ripple
-            alpha = int(ripple['alpha'] * 255)
-            color = self._adjust_color_alpha(ripple['color'], alpha)
+            alpha = int(ripple.alpha * 255)
+            color = _adjust_color_alpha(ripple.color, alpha)
             
-            self.canvas.create_oval(
-                ripple['x'] - ripple['radius'],
-                ripple['y'] - ripple['radius'],
-                ripple['x'] + ripple['radius'],
-                ripple['y'] + ripple['radius'],
-                outline=color,
-                width=2,
-                tags="ripples"
+            self.canvas.coords(
+                ripple.item,
+                ripple.x - ripple.radius,
+                ripple.y - ripple.radius,
+                ripple.x + ripple.radius,
+                ripple.y + ripple.radius
             )
-        
-        # Schedule next frame
-        self.canvas.after(30, self._animate_ripples)
+            self.canvas.itemconfig(ripple.item, outline=color)
     
-    def _animate_gradient(self, colors: List[str], duration: float):
-        """Animate flowing gradient."""
-        if not self.animation_running:
+    def _step_gradient(self, dt: float, canvas_width: int, canvas_height: int):
+        """Scroll the flowing gradient."""
+        # The gradient moves one lookup-table step per 100 ms; only redraw
+        # when that step or the canvas size changes
+        self._gradient_clock += dt * 10
+        offset = int(self._gradient_clock) % len(self._gradient_lut)
+        if offset == self._gradient_offset and self._gradient_size == (canvas_width, canvas_height):
             return
+        self._gradient_offset = offset
         
-        self.canvas.delete("gradient")
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        if Image is not None:
+            self._draw_gradient_image(canvas_width, canvas_height)
+        else:
+            self._draw_gradient_lines(canvas_width, canvas_height)
+    
+    def _draw_gradient_image(self, canvas_width: int, canvas_height: int):
+        """
+        Draw the gradient as a single image item.
         
-        # Create flowing gradient
-        for i in range(0, canvas_width, 5):
-            color_index = (i // 50) % len(colors)
-            next_color_index = (color_index + 1) % len(colors)
-            
-            # Interpolate between colors
-            blend_factor = (i % 50) / 50
-            color = self._blend_colors(colors[color_index], colors[next_color_index], blend_factor)
-            
-            self.canvas.create_line(
-                i, 0, i, canvas_height,
-                fill=color,
-                width=5,
-                tags="gradient"
+        A strip one gradient cycle wider than the canvas is rendered once
+        per canvas size; each frame pastes the window at the current
+        offset into the same PhotoImage, so Tk redraws one item.
+        """
+        lut = self._gradient_lut
+        
+        # Re-render the strip only when the canvas size changes
+        if self._gradient_photo is None or self._gradient_size != (canvas_width, canvas_height):
+            self.canvas.delete("gradient")
+            strip_width = canvas_width + 5 * len(lut)
+            self._gradient_strip = Image.new("RGB", (strip_width, canvas_height))
+            for idx, x in enumerate(range(0, strip_width, 5)):
+                self._gradient_strip.paste(_hex_to_rgb(lut[idx % len(lut)]), (x, 0, x + 5, canvas_height))
+            self._gradient_photo = ImageTk.PhotoImage("RGB", (canvas_width, canvas_height))
+            self.canvas.create_image(
+                0, 0,
+                anchor="nw",
+                image=self._gradient_photo,
+                tags=("gradient", "animation")
             )
+            self._gradient_size = (canvas_width, canvas_height)
         
-        # Schedule next frame
-        self.canvas.after(100, lambda: self._animate_gradient(colors, duration))
+        left = 5 * self._gradient_offset
+        self._gradient_photo.paste(
+            self._gradient_strip.crop((left, 0, left + canvas_width, canvas_height))
+        )
     
-    def _adjust_color_alpha(self, color: str, alpha: int) -> str:
-        """Adjust color alpha for transparency effects."""
-        # Convert hex to RGB
-        r = int(color[1:3], 16)
-        g = int(color[3:5], 16)
-        b = int(color[5:7], 16)
-        
-        # Apply alpha
-        r = int(r * alpha / 255)
-        g = int(g * alpha / 255)
-        b = int(b * alpha / 255)
+    def _draw_gradient_lines(self, canvas_width: int, canvas_height: int):
+        """Draw the gradient as vertical canvas lines (used without Pillow)."""
+        # (Re)create the gradient lines only when the canvas size changes
+        if not self._gradient_lines or self._gradient_size != (canvas_width, canvas_height):
+            self.canvas.delete("gradient")
+            self._gradient_lines = [
+                self.canvas.create_line(
+                    i, 0, i, canvas_height,
+                    width=5,
+                    tags=("gradient", "animation")
+                )
+                for i in range(0, canvas_width, 5)
+            ]
+            self._gradient_size = (canvas_width, canvas_height)
         
-        return f"#{r:02x}{g:02x}{b:02x}"
+        # Color each line from the lookup table, shifted one step per frame
+        lut = self._gradient_lut
+        offset = self._gradient_offset
+        for idx, line in enumerate(self._gradient_lines):
+            self.canvas.itemconfig(line, fill=lut[(idx + offset) % len(lut)])
     
-    def _blend_colors(self, color1: str, color2: str, factor: float) -> str:
-        """Blend two colors with a factor."""
-        # Convert hex to RGB
-        r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
-        r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
-        
-        # Blend
-        r = int(r1 * (1 - factor) + r2 * factor)
-        g = int(g1 * (1 - factor) + g2 * factor)
-        b = int(b1 * (1 - factor) + b2 * factor)
+    def _build_gradient_lut(self, colors: Sequence[str]) -> List[str]:
+        """
+        Precompute the colors of one full gradient cycle.
         
-        return f"#{r:02x}{g:02x}{b:02x}"
+        Lines are 5 pixels apart and each color pair blends over 50 pixels,
+        so the pattern repeats every ``10 * len(colors)`` lines.
+        """
+        lut = []
+        for i in range(0, 50 * len(colors), 5):
+            color_index = (i // 50) % len(colors)
+            next_color_index = (color_index + 1) % len(colors)
+            
+            # Interpolate between colors
+            blend_factor = (i % 50) / 50
+            lut.append(_blend_colors(colors[color_index], colors[next_color_index], blend_factor))
+        return lut
 
 class ProgressAnimation:
     """Animated progress bar with fluid effects."""
@@ -264,10 +449,16 @@ class ProgressAnimation:
         self.progress = 0
         self.target_progress = 0
         self.animation_running = False
+        
+        # Background, bar and label items, created on the first draw
+        self._items = None
     
     def animate_progress(self, target: float, duration: float = 1.0):
         """Animate progress to target value."""
         self.target_progress = target
+        # A running animation just heads for the new target
+        if self.animation_running:
+            return
         self.animation_running = True
         self._update_progress(duration)
     
@@ -289,35 +480,39 @@ class ProgressAnimation:
     
     def _draw_progress(self):
         """Draw the animated progress bar."""
-        self.canvas.delete("progress")
-        
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         
-        # Background
-        self.canvas.create_rectangle(
-            0, 0, canvas_width, canvas_height,
-            fill=self.theme.colors.bg_secondary,
-            outline="",
-            tags="progress"
-        )
+        if self._items is None:
+            self._items = (
+                # Background
+                self.canvas.create_rectangle(
+                    0, 0, 0, 0,
+                    fill=self.theme.colors.bg_secondary,
+                    outline="",
+                    tags="progress"
+                ),
+                # Progress bar
+                self.canvas.create_rectangle(
+                    0, 0, 0, 0,
+                    fill=self.theme.colors.primary_rose,
+                    outline="",
+                    tags="progress"
+                ),
+                # Progress text
+                self.canvas.create_text(
+                    0, 0,
+                    font=self.theme.fonts['heading'],
+                    fill=self.theme.colors.text_primary,
+                    tags="progress"
+                )
+            )
+        background, bar, label = self._items
         
-        # Progress bar
         progress_width = int(canvas_width * self.progress)
-        if progress_width > 0:
-            self.canvas.create_rectangle(
-                0, 0, progress_width, canvas_height,
-                fill=self.theme.colors.primary_rose,
-                outline="",
-                tags="progress"
-            )
+        self.canvas.coords(background, 0, 0, canvas_width, canvas_height)
+        self.canvas.coords(bar, 0, 0, max(progress_width, 0), canvas_height)
         
-        # Progress text
         percentage = int(self.progress * 100)
-        self.canvas.create_text(
-            canvas_width // 2, canvas_height // 2,
-            text=f"{percentage}%",
-            font=self.theme.fonts['heading'],
-            fill=self.theme.colors.text_primary,
-            tags="progress"
-        ) 
\ No newline at end of file
+        self.canvas.coords(label, canvas_width // 2, canvas_height // 2)
+        self.canvas.itemconfig(label, text=f"{percentage}%")
@@ -6,26 +6,220 @@ Aphrodite-inspired design and fluid animations.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import asyncio
+import functools
+import string
+import sys
 import threading
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Tuple
 import time
 
 from ..core.config import Config
 from ..core.engine import PurrifyEngine
-from .styles import AphroditeTheme
+from ..optimizers import OptimizeOptions
+from ..utils.compat import to_thread
+from .styles import get_theme
 from .widgets import (
     AphroditeButton, AphroditeCard, AphroditeProgressBar,
     AphroditeStatusCard, AphroditeAnimatedCanvas, AphroditeMenuBar
 )
 
+# Status polling intervals (ms) for a focused and an unfocused window
+STATUS_POLL_MS = 5000
+STATUS_POLL_BACKGROUND_MS = 30000
+
+# Saving a report copies this many Text lines at a time into a 64 KiB buffer
+REPORT_CHUNK_LINES = 512
+REPORT_WRITE_BUFFER = 64 * 1024
+
+# Status card metrics: (status key, warning threshold in percent)
+STATUS_THRESHOLDS = {
+    "cpu": ("cpu_usage_percent", 80),
+    "memory": ("memory_percent_used", 80),
+    "disk": ("disk_percent_used", 90),
+}
+
+# Threads for blocking work offloaded by engine coroutines
+# (asyncio.to_thread); matches the scanner's concurrent directory walkers
+BACKGROUND_WORKERS = 8
+
+# Results page templates; each field is rendered into its own Text tag
+SCAN_RESULTS_TEMPLATE = """
+Scan Completed Successfully!
+
+📊 Scan Results:
+• Files Scanned: {files_scanned}
+• Cache Files: {cache_files}
+• Temp Files: {temp_files}
+• Log Files: {log_files}
+• Large Files: {large_files}
+• Potential Savings: {potential_savings}
+• Scan Duration: {scan_duration:.2f}s
+
+🔍 Scan Errors: {error_count}
+"""
+
+CLEAN_RESULTS_TEMPLATE = """
+Cleaning Completed Successfully!
+
+🧹 Cleaning Results:
+• Files Cleaned: {files_cleaned}
+• Space Freed: {space_freed}
+• Clean Duration: {clean_duration:.2f}s
+• Backup Created: {backup_created}
+
+🔍 Clean Errors: {error_count}
+"""
+
+OPTIMIZE_RESULTS_TEMPLATE = """
+Optimization Completed Successfully!
+
+⚡ Optimization Results:
+• Optimizations Applied: {optimizations_applied}
+• Performance Improvement: {performance_improvement:.1f}%
+• Optimization Duration: {optimization_duration:.2f}s
+• Startup Items Optimized: {startup_items_optimized}
+• Memory Optimized: {memory_optimized}
+• Disk Optimized: {disk_optimized}
+
+🔍 Optimization Errors: {error_count}
+"""
+
+REPORT_TEMPLATE = """
+System Optimization Report
+Generated: {generated}
+
+📊 System Overview:
+{system_overview}
+
+🔍 Recent Scans:
+{recent_scans}
+
+🧹 Recent Cleanings:
+{recent_cleanings}
+
+⚡ Recent Optimizations:
+{recent_optimizations}
+
+🤖 AI Insights:
+{ai_insights}
+"""
+
+_FORMATTER = string.Formatter()
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+@functools.lru_cache(maxsize=128)
+def _format_bytes(bytes_value: int) -> str:
+    """Format bytes to human readable string."""
+    # Each unit spans 10 bits, so the unit index comes from the bit length
+    index = min((int(bytes_value).bit_length() - 1) // 10, 5) if bytes_value >= 1 else 0
+    return f"{bytes_value / (1 << (10 * index)):.1f} {_BYTE_UNITS[index]}"
+
+@functools.lru_cache(maxsize=None)
+def _parse_template(template: str) -> Tuple[Tuple[str, Optional[str], str], ...]:
+    """Split a template into (literal, field name, format spec) parts."""
+    return tuple((literal, name, spec) for literal, name, spec, _ in _FORMATTER.parse(template))
+
+def _fill_template(template: str, fields: Dict[str, Any]) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """Format each template field, keeping literals and fields apart."""
+    return [
+        (literal, name, format(fields[name], spec) if name is not None else None)
+        for literal, name, spec in _parse_template(template)
+    ]
+
+def _debounced(delay_ms: int):
+    """
+    Collapse repeated calls of a ``PurrifyGUI`` action into one.
+    
+    The first call disables the action's home-page button and runs the
+    action ``delay_ms`` later; calls in between are ignored.
+    """
+    def decorator(method):
+        name = method.__name__
+        
+        @functools.wraps(method)
+        def wrapper(self):
+            if name in self._pending_actions:
+                return
+            self._pending_actions.add(name)
+            button = self._quick_buttons.get(name)
+            if button is not None:
+                button.configure(state="disabled")
+            
+            def fire():
+                self._pending_actions.discard(name)
+                try:
+                    method(self)
+                finally:
+                    if button is not None:
+                        button.configure(state="normal")
+            
+            self.root.after(delay_ms, fire)
+        return wrapper
+    return decorator
+
+def _scan_results(scan_result) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """Build the scan results text parts."""
+    return _fill_template(SCAN_RESULTS_TEMPLATE, {
+        "files_scanned": scan_result.total_files_scanned,
+        "cache_files": scan_result.cache_files_found,
+        "temp_files": scan_result.temp_files_found,
+        "log_files": scan_result.log_files_found,
+        "large_files": scan_result.large_files_found,
+        "potential_savings": _format_bytes(scan_result.potential_space_savings),
+        "scan_duration": scan_result.scan_duration,
+        "error_count": len(scan_result.scan_errors),
+    })
+
+def _clean_results(clean_result) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """Build the cleaning results text parts."""
+    return _fill_template(CLEAN_RESULTS_TEMPLATE, {
+        "files_cleaned": clean_result.files_cleaned,
+        "space_freed": _format_bytes(clean_result.space_freed),
+        "clean_duration": clean_result.clean_duration,
+        "backup_created": 'Yes' if clean_result.backup_created else 'No',
+        "error_count": len(clean_result.clean_errors),
+    })
+
+def _optimize_results(opt_result) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """Build the optimization results text parts."""
+    return _fill_template(OPTIMIZE_RESULTS_TEMPLATE, {
+        "optimizations_applied": opt_result.optimizations_applied,
+        "performance_improvement": opt_result.performance_improvement,
+        "optimization_duration": opt_result.optimization_duration,
+        "startup_items_optimized": opt_result.startup_items_optimized,
+        "memory_optimized": 'Yes' if opt_result.memory_optimized else 'No',
+        "disk_optimized": 'Yes' if opt_result.disk_optimized else 'No',
+        "error_count": len(opt_result.optimization_errors),
+    })
+
+def _report_results(report_data: Dict[str, Any]) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """Build the report text parts, raising if the report failed."""
+    if 'error' in report_data:
+        raise RuntimeError(report_data['error'])
+    
+    return _fill_template(REPORT_TEMPLATE, {
+        "generated": time.strftime('%Y-%m-%d %H:%M:%S'),
+        "system_overview": report_data.get('system_overview', 'No data available'),
+        "recent_scans": report_data.get('recent_scans', 'No scans available'),
+        "recent_cleanings": report_data.get('recent_cleanings', 'No cleanings available'),
+        "recent_optimizations": report_data.get('recent_optimizations', 'No optimizations available'),
+        "ai_insights": report_data.get('ai_insights', 'No insights available'),
+    })
+
 class PurrifyGUI:
     """Main GUI application for Purrify with Aphrodite-inspired design."""
     
     def __init__(self):
         self.root = tk.Tk()
-        self.theme = AphroditeTheme()
+        # Stay hidden while the widgets are built so the window is drawn
+        # once, with its final layout
+        self.root.withdraw()
+        self.theme = get_theme()
         self.config = Config()
         self.engine = PurrifyEngine(self.config)
         
@@ -35,12 +229,46 @@ class PurrifyGUI:
         self.clean_running = False
         self.optimize_running = False
         
+        # Persistent event loop for engine coroutines, so each action
+        # doesn't create and tear down its own loop on a fresh thread
+        self._loop = asyncio.new_event_loop()
+        self._executor = ThreadPoolExecutor(
+            max_workers=BACKGROUND_WORKERS,
+            thread_name_prefix="purrify-bg"
+        )
+        self._loop.set_default_executor(self._executor)
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="purrify-loop",
+            daemon=True
+        )
+        self._loop_thread.start()
+        
+        # Last system status snapshot as (monotonic timestamp, data)
+        self._status_cache = (0.0, None)
+        self._closing = False
+        
+        # Window visibility, used to throttle polling and animations
+        self._visible = True
+        self._focused = True
+        self._status_timer = None
+        
+        # Nesting depth of _batched_updates blocks
+        self._batch_depth = 0
+        
+        # Debounced actions waiting to run, and their home-page buttons
+        self._pending_actions = set()
+        self._quick_buttons = {}
+        
         # Initialize GUI
         self._setup_window()
         self._apply_theme()
         self._create_widgets()
         self._setup_layout()
         self._start_background_animations()
+        
+        self.root.update_idletasks()
+        self.root.deiconify()
     
     def _setup_window(self):
         """Setup the main window."""
@@ -53,6 +281,16 @@ class PurrifyGUI:
         x = (self.root.winfo_screenwidth() // 2) - (1000 // 2)
         y = (self.root.winfo_screenheight() // 2) - (700 // 2)
         self.root.geometry(f"1000x700+{x}+{y}")
+        
+        # Track visibility and focus
+        self.root.bind("<Map>", self._on_map)
+        self.root.bind("<Unmap>", self._on_unmap)
+        self.root.bind("<Visibility>", self._on_visibility)
+        self.root.bind("<FocusIn>", self._on_focus_in)
+        self.root.bind("<FocusOut>", self._on_focus_out)
+        
+        # Shut down background work with the window
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
     
     def _apply_theme(self):
         """Apply the Aphrodite theme."""
@@ -62,12 +300,19 @@ class PurrifyGUI:
         """Create all GUI widgets."""
         # Menu bar
         self.menu_bar = AphroditeMenuBar(self.root)
-        self.menu_bar.add_menu_item("🏠 Home", self._show_home_page, "🏠")
-        self.menu_bar.add_menu_item("🔍 Scan", self._show_scan_page, "🔍")
-        self.menu_bar.add_menu_item("🧹 Clean", self._show_clean_page, "🧹")
-        self.menu_bar.add_menu_item("⚡ Optimize", self._show_optimize_page, "⚡")
-        self.menu_bar.add_menu_item("📊 Reports", self._show_reports_page, "📊")
-        self.menu_bar.add_menu_item("⚙️ Settings", self._show_settings_page, "⚙️")
+        for page_name, text, icon in (
+            ("home", "Home", "🏠"),
+            ("scan", "Scan", "🔍"),
+            ("clean", "Clean", "🧹"),
+            ("optimize", "Optimize", "⚡"),
+            ("reports", "Reports", "📊"),
+            ("settings", "Settings", "⚙️"),
+        ):
+            self.menu_bar.add_menu_item(
+                f"{icon} {text}",
+                lambda name=page_name: self._show_page(name),
+                icon
+            )
         
         # Main content area
         self.main_frame = tk.Frame(self.root, bg=self.theme.colors.bg_primary)
@@ -82,16 +327,25 @@ class PurrifyGUI:
         # Content frame
         self.content_frame = tk.Frame(
             self.main_frame,
-            bg="transparent"
+            bg=self.theme.colors.bg_primary
         )
         
-        # Create pages
-        self._create_home_page()
-        self._create_scan_page()
-        self._create_clean_page()
-        self._create_optimize_page()
-        self._create_reports_page()
-        self._create_settings_page()
+        # Safe mode is shown on both the clean and settings pages
+        self.safe_mode_var = tk.BooleanVar(value=True)
+        
+        # Pages are built on first visit
+        self._page_factories = {
+            "home": self._create_home_page,
+            "scan": self._create_scan_page,
+            "clean": self._create_clean_page,
+            "optimize": self._create_optimize_page,
+            "reports": self._create_reports_page,
+            "settings": self._create_settings_page,
+        }
+        self._pages = {}
+        
+        # Template last rendered into each results Text widget, by path
+        self._rendered_templates = {}
         
         # Status bar
         self.status_bar = tk.Frame(
@@ -104,7 +358,7 @@ class PurrifyGUI:
         self.status_label = tk.Label(
             self.status_bar,
             text="Ready to purify your system ✨",
-            **self.theme.styles['label_body']
+            **self.theme.label_style('label_body', self.status_bar)
         )
         self.status_label.pack(side="left", padx=10, pady=5)
     
@@ -122,54 +376,47 @@ class PurrifyGUI:
         self.status_bar.pack(fill="x", side="bottom")
         
         # Show home page by default
-        self._show_home_page()
+        self._show_page("home")
     
     def _create_home_page(self):
         """Create the home page."""
-        self.home_page = tk.Frame(self.content_frame, bg="transparent")
+        self.home_page = tk.Frame(self.content_frame, bg=self.theme.colors.bg_primary)
         
         # Welcome title
         title_label = tk.Label(
             self.home_page,
             text="🐱 Welcome to Purrify",
-            **self.theme.styles['label_title']
+            **self.theme.label_style('label_title', self.home_page)
         )
         title_label.pack(pady=(0, 20))
         
         subtitle_label = tk.Label(
             self.home_page,
             text="AI-Driven System Optimization with Aphrodite's Grace",
-            **self.theme.styles['label_body']
+            **self.theme.label_style('label_body', self.home_page)
         )
         subtitle_label.pack(pady=(0, 40))
         
         # Quick action buttons
-        button_frame = tk.Frame(self.home_page, bg="transparent")
+        button_frame = tk.Frame(self.home_page, bg=self.theme.colors.bg_primary)
         button_frame.pack(pady=20)
         
-        AphroditeButton(
-            button_frame,
-            text="🔍 Quick Scan",
-            command=self._quick_scan,
-            style="primary"
-        ).pack(side="left", padx=10)
-        
-        AphroditeButton(
-            button_frame,
-            text="🧹 Safe Clean",
-            command=self._safe_clean,
-            style="secondary"
-        ).pack(side="left", padx=10)
-        
-        AphroditeButton(
-            button_frame,
-            text="⚡ Optimize",
-            command=self._quick_optimize,
-            style="ghost"
-        ).pack(side="left", padx=10)
+        for text, command, style in (
+            ("🔍 Quick Scan", self._quick_scan, "primary"),
+            ("🧹 Safe Clean", self._safe_clean, "secondary"),
+            ("⚡ Optimize", self._quick_optimize, "ghost"),
+        ):
+            button = AphroditeButton(
+                button_frame,
+                text=text,
+                command=command,
+                style=style
+            )
+            button.pack(side="left", padx=10)
+            self._quick_buttons[command.__name__] = button
         
         # System status cards
-        status_frame = tk.Frame(self.home_page, bg="transparent")
+        status_frame = tk.Frame(self.home_page, bg=self.theme.colors.bg_primary)
         status_frame.pack(pady=40)
         
         self.cpu_card = AphroditeStatusCard(
@@ -199,18 +446,27 @@ class PurrifyGUI:
         )
         self.disk_card.pack(side="left", padx=10)
         
+        # (status key, threshold, value setter, status setter) per card
+        cards = {"cpu": self.cpu_card, "memory": self.memory_card, "disk": self.disk_card}
+        self._status_updaters = [
+            (key, threshold, cards[name].update_value, cards[name].update_status)
+            for name, (key, threshold) in STATUS_THRESHOLDS.items()
+        ]
+        
         # Update system status
         self._update_system_status()
+        
+        return self.home_page
     
     def _create_scan_page(self):
         """Create the scan page."""
-        self.scan_page = tk.Frame(self.content_frame, bg="transparent")
+        self.scan_page = tk.Frame(self.content_frame, bg=self.theme.colors.bg_primary)
         
         # Title
         title_label = tk.Label(
             self.scan_page,
             text="🔍 System Scanner",
-            **self.theme.styles['label_title']
+            **self.theme.label_style('label_title', self.scan_page)
         )
         title_label.pack(pady=(0, 20))
         
@@ -222,23 +478,10 @@ class PurrifyGUI:
         self.quick_scan_var = tk.BooleanVar(value=True)
         self.detailed_scan_var = tk.BooleanVar(value=False)
         
-        tk.Checkbutton(
-            options_card,
-            text="Quick Scan (Fast)",
-            variable=self.quick_scan_var,
-            bg="transparent",
-            fg=self.theme.colors.text_primary,
-            selectcolor=self.theme.colors.bg_secondary
-        ).pack(anchor="w", padx=10, pady=5)
-        
-        tk.Checkbutton(
-            options_card,
-            text="Detailed Scan (Thorough)",
-            variable=self.detailed_scan_var,
-            bg="transparent",
-            fg=self.theme.colors.text_primary,
-            selectcolor=self.theme.colors.bg_secondary
-        ).pack(anchor="w", padx=10, pady=5)
+        self._make_checkboxes(options_card, [
+            ("Quick Scan (Fast)", self.quick_scan_var),
+            ("Detailed Scan (Thorough)", self.detailed_scan_var),
+        ])
         
         # Scan button
         self.scan_button = AphroditeButton(
@@ -268,16 +511,18 @@ class PurrifyGUI:
             borderwidth=0
         )
         self.scan_results_text.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        return self.scan_page
     
     def _create_clean_page(self):
         """Create the clean page."""
-        self.clean_page = tk.Frame(self.content_frame, bg="transparent")
+        self.clean_page = tk.Frame(self.content_frame, bg=self.theme.colors.bg_primary)
         
         # Title
         title_label = tk.Label(
             self.clean_page,
             text="🧹 System Cleaner",
-            **self.theme.styles['label_title']
+            **self.theme.label_style('label_title', self.clean_page)
         )
         title_label.pack(pady=(0, 20))
         
@@ -289,43 +534,13 @@ class PurrifyGUI:
         self.clean_caches_var = tk.BooleanVar(value=True)
         self.clean_logs_var = tk.BooleanVar(value=True)
         self.clean_temp_var = tk.BooleanVar(value=True)
-        self.safe_mode_var = tk.BooleanVar(value=True)
         
-        tk.Checkbutton(
-            options_card,
-            text="🗂️ Application Caches",
-            variable=self.clean_caches_var,
-            bg="transparent",
-            fg=self.theme.colors.text_primary,
-            selectcolor=self.theme.colors.bg_secondary
-        ).pack(anchor="w", padx=10, pady=5)
-        
-        tk.Checkbutton(
-            options_card,
-            text="📝 System Logs",
-            variable=self.clean_logs_var,
-            bg="transparent",
-            fg=self.theme.colors.text_primary,
-            selectcolor=self.theme.colors.bg_secondary
-        ).pack(anchor="w", padx=10, pady=5)
-        
-        tk.Checkbutton(
-            options_card,
-            text="🗑️ Temporary Files",
-            variable=self.clean_temp_var,
-            bg="transparent",
-            fg=self.theme.colors.text_primary,
-            selectcolor=self.theme.colors.bg_secondary
-        ).pack(anchor="w", padx=10, pady=5)
-        
-        tk.Checkbutton(
-            options_card,
-            text="🛡️ Safe Mode (Preview Only)",
-            variable=self.safe_mode_var,
-            bg="transparent",
-            fg=self.theme.colors.text_primary,
-            selectcolor=self.theme.colors.bg_secondary
-        ).pack(anchor="w", padx=10, pady=5)
+        self._make_checkboxes(options_card, [
+            ("🗂️ Application Caches", self.clean_caches_var),
+            ("📝 System Logs", self.clean_logs_var),
+            ("🗑️ Temporary Files", self.clean_temp_var),
+            ("🛡️ Safe Mode (Preview Only)", self.safe_mode_var),
+        ])
         
         # Clean button
         self.clean_button = AphroditeButton(
@@ -355,16 +570,18 @@ class PurrifyGUI:
             borderwidth=0
         )
         self.clean_results_text.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        return self.clean_page
     
     def _create_optimize_page(self):
         """Create the optimize page."""
-        self.optimize_page = tk.Frame(self.content_frame, bg="transparent")
+        self.optimize_page = tk.Frame(self.content_frame, bg=self.theme.colors.bg_primary)
         
         # Title
         title_label = tk.Label(
             self.optimize_page,
             text="⚡ Performance Optimizer",
-            **self.theme.styles['label_title']
+            **self.theme.label_style('label_title', self.optimize_page)
         )
         title_label.pack(pady=(0, 20))
         
@@ -377,32 +594,11 @@ class PurrifyGUI:
         self.opt_memory_var = tk.BooleanVar(value=True)
         self.opt_disk_var = tk.BooleanVar(value=True)
         
-        tk.Checkbutton(
-            options_card,
-            text="🚀 Startup Optimization",
-            variable=self.opt_startup_var,
-            bg="transparent",
-            fg=self.theme.colors.text_primary,
-            selectcolor=self.theme.colors.bg_secondary
-        ).pack(anchor="w", padx=10, pady=5)
-        
-        tk.Checkbutton(
-            options_card,
-            text="🧠 Memory Optimization",
-            variable=self.opt_memory_var,
-            bg="transparent",
-            fg=self.theme.colors.text_primary,
-            selectcolor=self.theme.colors.bg_secondary
-        ).pack(anchor="w", padx=10, pady=5)
-        
-        tk.Checkbutton(
-            options_card,
-            text="💾 Disk Optimization",
-            variable=self.opt_disk_var,
-            bg="transparent",
-            fg=self.theme.colors.text_primary,
-            selectcolor=self.theme.colors.bg_secondary
-        ).pack(anchor="w", padx=10, pady=5)
+        self._make_checkboxes(options_card, [
+            ("🚀 Startup Optimization", self.opt_startup_var),
+            ("🧠 Memory Optimization", self.opt_memory_var),
+            ("💾 Disk Optimization", self.opt_disk_var),
+        ])
         
         # Optimize button
         self.optimize_button = AphroditeButton(
@@ -432,21 +628,23 @@ class PurrifyGUI:
             borderwidth=0
         )
         self.optimize_results_text.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        return self.optimize_page
     
     def _create_reports_page(self):
         """Create the reports page."""
-        self.reports_page = tk.Frame(self.content_frame, bg="transparent")
+        self.reports_page = tk.Frame(self.content_frame, bg=self.theme.colors.bg_primary)
         
         # Title
         title_label = tk.Label(
             self.reports_page,
             text="📊 System Reports",
-            **self.theme.styles['label_title']
+            **self.theme.label_style('label_title', self.reports_page)
         )
         title_label.pack(pady=(0, 20))
         
         # Report options
-        button_frame = tk.Frame(self.reports_page, bg="transparent")
+        button_frame = tk.Frame(self.reports_page, bg=self.theme.colors.bg_primary)
         button_frame.pack(pady=20)
         
         AphroditeButton(
@@ -474,16 +672,18 @@ class PurrifyGUI:
             borderwidth=0
         )
         self.report_text.pack(fill="both", expand=True, padx=20, pady=10)
+        
+        return self.reports_page
     
     def _create_settings_page(self):
         """Create the settings page."""
-        self.settings_page = tk.Frame(self.content_frame, bg="transparent")
+        self.settings_page = tk.Frame(self.content_frame, bg=self.theme.colors.bg_primary)
         
         # Title
         title_label = tk.Label(
             self.settings_page,
             text="⚙️ Settings",
-            **self.theme.styles['label_title']
+            **self.theme.label_style('label_title', self.settings_page)
         )
         title_label.pack(pady=(0, 20))
         
@@ -493,35 +693,13 @@ class PurrifyGUI:
         
         # Settings options
         self.auto_backup_var = tk.BooleanVar(value=True)
-        self.safe_mode_var = tk.BooleanVar(value=True)
         self.verbose_logging_var = tk.BooleanVar(value=False)
         
-        tk.Checkbutton(
-            settings_card,
-            text="💾 Auto Backup",
-            variable=self.auto_backup_var,
-            bg="transparent",
-            fg=self.theme.colors.text_primary,
-            selectcolor=self.theme.colors.bg_secondary
-        ).pack(anchor="w", padx=10, pady=5)
-        
-        tk.Checkbutton(
-            settings_card,
-            text="🛡️ Safe Mode",
-            variable=self.safe_mode_var,
-            bg="transparent",
-            fg=self.theme.colors.text_primary,
-            selectcolor=self.theme.colors.bg_secondary
-        ).pack(anchor="w", padx=10, pady=5)
-        
-        tk.Checkbutton(
-            settings_card,
-            text="📝 Verbose Logging",
-            variable=self.verbose_logging_var,
-            bg="transparent",
-            fg=self.theme.colors.text_primary,
-            selectcolor=self.theme.colors.bg_secondary
-        ).pack(anchor="w", padx=10, pady=5)
+        self._make_checkboxes(settings_card, [
+            ("💾 Auto Backup", self.auto_backup_var),
+            ("🛡️ Safe Mode", self.safe_mode_var),
+            ("📝 Verbose Logging", self.verbose_logging_var),
+        ])
         
         # Save button
         AphroditeButton(
@@ -530,94 +708,202 @@ class PurrifyGUI:
             command=self._save_settings,
             style="primary"
         ).pack(pady=20)
+        
+        return self.settings_page
+    
+    def _make_checkboxes(self, parent, items):
+        """Create a column of themed checkboxes from (text, variable) pairs."""
+        for text, variable in items:
+            ttk.Checkbutton(
+                parent,
+                text=text,
+                variable=variable,
+                style="Aphrodite.TCheckbutton"
+            ).pack(anchor="w", padx=10, pady=5)
     
     def _start_background_animations(self):
         """Start background animations."""
-        self.background_canvas.start_water_flow()
+        if self._visible:
+            self.background_canvas.set_max_fps(self.config.general.max_fps)
+            self.background_canvas.start_water_flow()
     
-    def _update_system_status(self):
-        """Update system status display."""
-        def update():
+    def _on_map(self, event):
+        """Resume polling and animations when the window is shown."""
+        # Child widgets share the root's bindings; only react to the root
+        if event.widget is not self.root or self._visible:
+            return
+        self._visible = True
+        self._start_background_animations()
+        if self._status_timer is None:
+            self._update_system_status()
+    
+    def _on_unmap(self, event):
+        """Pause animations while the window is minimized."""
+        if event.widget is not self.root:
+            return
+        self._visible = False
+        self.background_canvas.stop_animations()
+    
+    def _on_visibility(self, event):
+        """Treat a fully covered window like a minimized one."""
+        if event.widget is not self.root:
+            return
+        if event.state == "VisibilityFullyObscured":
+            self._on_unmap(event)
+        else:
+            self._on_map(event)
+    
+    def _on_focus_in(self, event):
+        """Note that the window has focus."""
+        self._focused = True
+    
+    def _on_focus_out(self, event):
+        """Note that focus left the application, not just a widget."""
+        # Focus moving between widgets also sends FocusOut, so check
+        # who has focus once Tk has settled
+        def check():
             try:
-                status = asyncio.run(self.engine.get_system_status())
-                
-                if 'error' not in status:
-                    # Update CPU
-                    cpu_percent = status.get('cpu_usage_percent', 0)
-                    self.cpu_card.update_value(f"{cpu_percent:.1f}%")
-                    self.cpu_card.update_status('normal' if cpu_percent < 80 else 'warning')
-                    
-                    # Update Memory
-                    memory_percent = status.get('memory_percent_used', 0)
-                    self.memory_card.update_value(f"{memory_percent:.1f}%")
-                    self.memory_card.update_status('normal' if memory_percent < 80 else 'warning')
-                    
-                    # Update Disk
-                    disk_percent = status.get('disk_percent_used', 0)
-                    self.disk_card.update_value(f"{disk_percent:.1f}%")
-                    self.disk_card.update_status('normal' if disk_percent < 90 else 'warning')
-                
+                self._focused = self.root.focus_get() is not None
+            except KeyError:
+                self._focused = True
+        self.root.after_idle(check)
+    
+    def _submit(self, coro, on_done, on_error, prepare=None):
+        """
+        Run a coroutine on the background event loop.
+        
+        ``on_done`` is called with the result, or ``on_error`` with the
+        exception, back on the Tk thread. ``prepare``, if given, turns the
+        result into what ``on_done`` receives before it reaches Tk.
+        """
+        def done(future):
+            # The window may be gone by the time the work finishes
+            if self._closing:
+                return
+            try:
+                result = future.result()
+                if prepare is not None:
+                    result = prepare(result)
             except Exception as e:
-                print(f"Error updating system status: {e}")
+                self.root.after(0, on_error, e)
+            else:
+                self.root.after(0, on_done, result)
         
-        # Update every 5 seconds
-        self.root.after(5000, self._update_system_status)
-        update()
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        future.add_done_callback(done)
+        return future
     
-    def _show_page(self, page_name: str):
-        """Show a specific page."""
-        # Hide all pages
-        for page in [self.home_page, self.scan_page, self.clean_page, 
-                    self.optimize_page, self.reports_page, self.settings_page]:
-            page.pack_forget()
+    @contextmanager
+    def _batched_updates(self):
+        """
+        Group several widget changes into one redraw.
+        
+        Blocks may nest; pending idle work is flushed once when the
+        outermost block exits. Use this rather than ``update()``, which
+        also runs pending event handlers and can re-enter callbacks.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.root.update_idletasks()
+    
+    def _update_system_status(self):
+        """Update system status display."""
+        # Stop polling while hidden or away from the home page, where the
+        # status cards live; _on_map and _show_page re-arm it
+        if not self._visible or self.root.state() == 'iconic' or self.current_page != "home":
+            self._status_timer = None
+            return
         
-        # Show selected page
-        if page_name == "home":
-            self.home_page.pack(fill="both", expand=True)
-        elif page_name == "scan":
-            self.scan_page.pack(fill="both", expand=True)
-        elif page_name == "clean":
-            self.clean_page.pack(fill="both", expand=True)
-        elif page_name == "optimize":
-            self.optimize_page.pack(fill="both", expand=True)
-        elif page_name == "reports":
-            self.reports_page.pack(fill="both", expand=True)
-        elif page_name == "settings":
-            self.settings_page.pack(fill="both", expand=True)
+        # CPU and memory are refreshed every tick; the full status (disk and
+        # the other slow probes) only once the cached snapshot goes stale
+        cached_at, cached = self._status_cache
+        if cached is not None and time.monotonic() - cached_at < self.config.general.status_poll_ttl:
+            self._submit(
+                self.engine.get_resource_usage(),
+                lambda usage: self._apply_resource_usage(cached, usage),
+                lambda e: print(f"Error updating system status: {e}")
+            )
+        else:
+            self._submit(
+                self.engine.get_system_status(),
+                self._cache_system_status,
+                lambda e: print(f"Error updating system status: {e}")
+            )
         
-        self.current_page = page_name
+        # Poll less often while the window is in the background
+        interval = STATUS_POLL_MS if self._focused else STATUS_POLL_BACKGROUND_MS
+        self._status_timer = self.root.after(interval, self._update_system_status)
     
-    def _show_home_page(self):
-        self._show_page("home")
-    
-    def _show_scan_page(self):
-        self._show_page("scan")
+    def _cache_system_status(self, status: Dict[str, Any]):
+        """Remember a fresh status snapshot and display it."""
+        if 'error' not in status:
+            self._status_cache = (time.monotonic(), status)
+        self._apply_system_status(status)
     
-    def _show_clean_page(self):
-        self._show_page("clean")
-    
-    def _show_optimize_page(self):
-        self._show_page("optimize")
+    def _apply_resource_usage(self, cached: Dict[str, Any], usage: Dict[str, Any]):
+        """Show fresh CPU and memory figures over a cached status snapshot."""
+        if 'error' in usage:
+            return
+        self._apply_system_status({**cached, **usage})
     
-    def _show_reports_page(self):
-        self._show_page("reports")
+    def _apply_system_status(self, status: Dict[str, Any]):
+        """Show a system status snapshot on the status cards."""
+        if 'error' in status:
+            return
+        
+        with self._batched_updates():
+            for key, threshold, update_value, update_status in self._status_updaters:
+                percent = status.get(key, 0)
+                update_value("%.1f%%" % percent)
+                update_status('normal' if percent < threshold else 'warning')
     
-    def _show_settings_page(self):
-        self._show_page("settings")
+    def _show_page(self, page_name: str):
+        """Show a specific page."""
+        # Build the page the first time it is shown
+        page = self._pages.get(page_name)
+        if page is None:
+            page = self._pages[page_name] = self._page_factories[page_name]()
+        
+        # Hide the page being replaced
+        current = self._pages.get(self.current_page)
+        if current is not None and current is not page:
+            current.pack_forget()
+        
+        # Show selected page
+        page.pack(fill="both", expand=True)
+        
+        # The content pages cover the background; only home shows it
+        self.background_canvas.set_animation_enabled(page_name == "home")
+        
+        returning_home = page_name == "home" and self.current_page != "home"
+        self.current_page = page_name
+        
+        # Refresh the status cards straight away when coming back home
+        if returning_home:
+            if self._status_timer is not None:
+                self.root.after_cancel(self._status_timer)
+            self._update_system_status()
     
+    @_debounced(50)
     def _quick_scan(self):
         """Perform a quick scan."""
-        self._show_scan_page()
+        self._show_page("scan")
         self._start_scan()
     
+    @_debounced(50)
     def _safe_clean(self):
         """Perform safe cleaning."""
-        self._show_clean_page()
+        self._show_page("clean")
         self._start_cleaning()
     
+    @_debounced(50)
     def _quick_optimize(self):
         """Perform quick optimization."""
-        self._show_optimize_page()
+        self._show_page("optimize")
         self._start_optimization()
     
     def _start_scan(self):
@@ -629,52 +915,32 @@ class PurrifyGUI:
         self.scan_button.configure(state="disabled", text="🔍 Scanning...")
         self.scan_progress.set_progress(0)
         
-        def scan_thread():
-            try:
-                # Determine scan mode
-                quick_mode = self.quick_scan_var.get()
-                detailed_mode = self.detailed_scan_var.get()
-                
-                # Run scan
-                scan_result = asyncio.run(self.engine.scan_system(
-                    quick_mode=quick_mode,
-                    detailed_mode=detailed_mode
-                ))
-                
-                # Update UI
-                self.root.after(0, lambda: self._scan_completed(scan_result))
-                
-            except Exception as e:
-                self.root.after(0, lambda: self._scan_error(str(e)))
-        
-        threading.Thread(target=scan_thread, daemon=True).start()
+        # Determine scan mode
+        quick_mode = self.quick_scan_var.get()
+        detailed_mode = self.detailed_scan_var.get()
+        
+        # Run scan
+        self._submit(
+            self.engine.scan_system(
+                quick_mode=quick_mode,
+                detailed_mode=detailed_mode
+            ),
+            self._scan_completed,
+            lambda e: self._scan_error(str(e)),
+            prepare=_scan_results
+        )
     
-    def _scan_completed(self, scan_result):
+    def _scan_completed(self, results):
         """Handle scan completion."""
-        self.scan_running = False
-        self.scan_button.configure(state="normal", text="🔍 Start Scan")
-        self.scan_progress.set_progress(1.0)
-        
-        # Display results
-        results_text = f"""
-Scan Completed Successfully!
-
-📊 Scan Results:
-• Files Scanned: {scan_result.total_files_scanned}
-• Cache Files: {scan_result.cache_files_found}
-• Temp Files: {scan_result.temp_files_found}
-• Log Files: {scan_result.log_files_found}
-• Large Files: {scan_result.large_files_found}
-• Potential Savings: {self._format_bytes(scan_result.potential_space_savings)}
-• Scan Duration: {scan_result.scan_duration:.2f}s
-
-🔍 Scan Errors: {len(scan_result.scan_errors)}
-"""
-        
-        self.scan_results_text.delete(1.0, tk.END)
-        self.scan_results_text.insert(1.0, results_text)
-        
-        self.status_label.configure(text="Scan completed successfully! ✨")
+        with self._batched_updates():
+            self.scan_running = False
+            self.scan_button.configure(state="normal", text="🔍 Start Scan")
+            self.scan_progress.set_progress(1.0)
+            
+            # Display results
+            self._render_results(self.scan_results_text, SCAN_RESULTS_TEMPLATE, results)
+            
+            self.status_label.configure(text="Scan completed successfully! ✨")
     
     def _scan_error(self, error: str):
         """Handle scan error."""
@@ -694,55 +960,38 @@ Scan Completed Successfully!
         self.clean_button.configure(state="disabled", text="🧹 Cleaning...")
         self.clean_progress.set_progress(0)
         
-        def clean_thread():
-            try:
-                # Determine cleaning options
-                clean_options = {
-                    "caches": self.clean_caches_var.get(),
-                    "logs": self.clean_logs_var.get(),
-                    "temp_files": self.clean_temp_var.get(),
-                }
-                
-                safe_mode = self.safe_mode_var.get()
-                
-                # Run cleaning
-                clean_result = asyncio.run(self.engine.clean_system(
-                    clean_options=clean_options,
-                    safe_mode=safe_mode,
-                    create_backup=True
-                ))
-                
-                # Update UI
-                self.root.after(0, lambda: self._clean_completed(clean_result))
-                
-            except Exception as e:
-                self.root.after(0, lambda: self._clean_error(str(e)))
-        
-        threading.Thread(target=clean_thread, daemon=True).start()
+        # Determine cleaning options
+        clean_options = {
+            "caches": self.clean_caches_var.get(),
+            "logs": self.clean_logs_var.get(),
+            "temp_files": self.clean_temp_var.get(),
+        }
+        
+        safe_mode = self.safe_mode_var.get()
+        
+        # Run cleaning
+        self._submit(
+            self.engine.clean_system(
+                clean_options=clean_options,
+                safe_mode=safe_mode,
+                create_backup=True
+            ),
+            self._clean_completed,
+            lambda e: self._clean_error(str(e)),
+            prepare=_clean_results
+        )
     
-    def _clean_completed(self, clean_result):
+    def _clean_completed(self, results):
         """Handle cleaning completion."""
-        self.clean_running = False
-        self.clean_button.configure(state="normal", text="🧹 Start Cleaning")
-        self.clean_progress.set_progress(1.0)
-        
-        # Display results
-        results_text = f"""
-Cleaning Completed Successfully!
-
-🧹 Cleaning Results:
-• Files Cleaned: {clean_result.files_cleaned}
-• Space Freed: {self._format_bytes(clean_result.space_freed)}
-• Clean Duration: {clean_result.clean_duration:.2f}s
-• Backup Created: {'Yes' if clean_result.backup_created else 'No'}
-
-🔍 Clean Errors: {len(clean_result.clean_errors)}
-"""
-        
-        self.clean_results_text.delete(1.0, tk.END)
-        self.clean_results_text.insert(1.0, results_text)
-        
-        self.status_label.configure(text="Cleaning completed successfully! ✨")
+        with self._batched_updates():
+            self.clean_running = False
+            self.clean_button.configure(state="normal", text="🧹 Start Cleaning")
+            self.clean_progress.set_progress(1.0)
+            
+            # Display results
+            self._render_results(self.clean_results_text, CLEAN_RESULTS_TEMPLATE, results)
+            
+            self.status_label.configure(text="Cleaning completed successfully! ✨")
     
     def _clean_error(self, error: str):
         """Handle cleaning error."""
@@ -762,54 +1011,35 @@ Cleaning Completed Successfully!
         self.optimize_button.configure(state="disabled", text="⚡ Optimizing...")
         self.optimize_progress.set_progress(0)
         
-        def optimize_thread():
-            try:
-                # Determine optimization options
-                opt_options = {
-                    "startup": self.opt_startup_var.get(),
-                    "memory": self.opt_memory_var.get(),
-                    "disk": self.opt_disk_var.get(),
-                }
-                
-                # Run optimization
-                opt_result = asyncio.run(self.engine.optimize_system(
-                    optimization_options=opt_options,
-                    safe_mode=True
-                ))
-                
-                # Update UI
-                self.root.after(0, lambda: self._optimize_completed(opt_result))
-                
-            except Exception as e:
-                self.root.after(0, lambda: self._optimize_error(str(e)))
+        # Determine optimization options
+        opt_options = OptimizeOptions(
+            startup=self.opt_startup_var.get(),
+            memory=self.opt_memory_var.get(),
+            disk=self.opt_disk_var.get(),
+        )
         
-        threading.Thread(target=optimize_thread, daemon=True).start()
+        # Run optimization
+        self._submit(
+            self.engine.optimize_system(
+                optimization_options=opt_options,
+                safe_mode=True
+            ),
+            self._optimize_completed,
+            lambda e: self._optimize_error(str(e)),
+            prepare=_optimize_results
+        )
     
-    def _optimize_completed(self, opt_result):
+    def _optimize_completed(self, results):
         """Handle optimization completion."""
-        self.optimize_running = False
-        self.optimize_button.configure(state="normal", text="⚡ Start Optimization")
-        self.optimize_progress.set_progress(1.0)
-        
-        # Display results
-        results_text = f"""
-Optimization Completed Successfully!
-
-⚡ Optimization Results:
-• Optimizations Applied: {opt_result.optimizations_applied}
-• Performance Improvement: {opt_result.performance_improvement:.1f}%
-• Optimization Duration: {opt_result.optimization_duration:.2f}s
-• Startup Items Optimized: {opt_result.startup_items_optimized}
-• Memory Optimized: {'Yes' if opt_result.memory_optimized else 'No'}
-• Disk Optimized: {'Yes' if opt_result.disk_optimized else 'No'}
-
-🔍 Optimization Errors: {len(opt_result.optimization_errors)}
-"""
-        
-        self.optimize_results_text.delete(1.0, tk.END)
-        self.optimize_results_text.insert(1.0, results_text)
-        
-        self.status_label.configure(text="Optimization completed successfully! ✨")
+        with self._batched_updates():
+            self.optimize_running = False
+            self.optimize_button.configure(state="normal", text="⚡ Start Optimization")
+            self.optimize_progress.set_progress(1.0)
+            
+            # Display results
+            self._render_results(self.optimize_results_text, OPTIMIZE_RESULTS_TEMPLATE, results)
+            
+            self.status_label.configure(text="Optimization completed successfully! ✨")
     
     def _optimize_error(self, error: str):
         """Handle optimization error."""
@@ -822,52 +1052,64 @@ Optimization Completed Successfully!
     
     def _generate_report(self):
         """Generate system report."""
-        try:
-            report_data = asyncio.run(self.engine.generate_report(detailed=True))
-            
-            if 'error' not in report_data:
-                report_text = f"""
-System Optimization Report
-Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}
-
-📊 System Overview:
-{report_data.get('system_overview', 'No data available')}
-
-🔍 Recent Scans:
-{report_data.get('recent_scans', 'No scans available')}
-
-🧹 Recent Cleanings:
-{report_data.get('recent_cleanings', 'No cleanings available')}
-
-⚡ Recent Optimizations:
-{report_data.get('recent_optimizations', 'No optimizations available')}
-
-🤖 AI Insights:
-{report_data.get('ai_insights', 'No insights available')}
-"""
-                
-                self.report_text.delete(1.0, tk.END)
-                self.report_text.insert(1.0, report_text)
-                
-                self.status_label.configure(text="Report generated successfully! 📊")
-            else:
-                messagebox.showerror("Report Error", f"Failed to generate report: {report_data['error']}")
-                
-        except Exception as e:
-            messagebox.showerror("Report Error", f"Failed to generate report: {e}")
+        self._submit(
+            self.engine.generate_report(detailed=True),
+            self._show_report,
+            lambda e: messagebox.showerror("Report Error", f"Failed to generate report: {e}"),
+            prepare=_report_results
+        )
+    
+    def _show_report(self, results):
+        """Display a generated report."""
+        with self._batched_updates():
+            self._render_results(self.report_text, REPORT_TEMPLATE, results)
+            self.status_label.configure(text="Report generated successfully! 📊")
+    
+    def _render_results(self, widget: tk.Text, template: str,
+                        parts: List[Tuple[str, Optional[str], Optional[str]]]):
+        """
+        Show a filled-in template (see ``_fill_template``) in a results
+        Text widget.
+        
+        The first render writes the whole text and tags each field's span
+        ``field:<name>``. Later renders of the same template only replace
+        the spans whose text changed.
+        """
+        # Patch in place while every field span is still present; a field
+        # rendered as empty text loses its tag and forces a full rewrite
+        if self._rendered_templates.get(str(widget)) is template and all(
+            widget.tag_ranges(f"field:{name}") for _, name, _ in parts if name is not None
+        ):
+            for _, name, text in parts:
+                if name is None:
+                    continue
+                tag = f"field:{name}"
+                if widget.get(f"{tag}.first", f"{tag}.last") != text:
+                    widget.replace(f"{tag}.first", f"{tag}.last", text, (tag,))
+            return
+        
+        widget.delete(1.0, tk.END)
+        for literal, name, text in parts:
+            if literal:
+                widget.insert(tk.END, literal)
+            if name is not None:
+                widget.insert(tk.END, text, (f"field:{name}",))
+        self._rendered_templates[str(widget)] = template
     
     def _save_report(self):
         """Save report to file."""
         try:
-            from tkinter import filedialog
             filename = filedialog.asksaveasfilename(
                 defaultextension=".txt",
                 filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
             )
             
             if filename:
-                with open(filename, 'w') as f:
-                    f.write(self.report_text.get(1.0, tk.END))
+                # Copy the report out in line chunks rather than one string
+                last_line = int(self.report_text.index('end-1c').split('.')[0])
+                with open(filename, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER) as f:
+                    for start in range(1, last_line + 1, REPORT_CHUNK_LINES):
+                        f.write(self.report_text.get(f"{start}.0", f"{start + REPORT_CHUNK_LINES}.0"))
                 
                 messagebox.showinfo("Success", f"Report saved to {filename}")
                 self.status_label.configure(text="Report saved successfully! 💾")
@@ -881,23 +1123,40 @@ Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}
             # Update config
             self.config.general.auto_backup = self.auto_backup_var.get()
             self.config.general.safe_mode = self.safe_mode_var.get()
-            
-            # Save config
-            self.config.save()
-            
-            messagebox.showinfo("Success", "Settings saved successfully!")
-            self.status_label.configure(text="Settings saved successfully! ⚙️")
-            
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save settings: {e}")
+            return
+        
+        # Write the file off the Tk thread
+        self._submit(
+            to_thread(self.config.save),
+            self._on_settings_saved,
+            lambda e: messagebox.showerror("Save Error", f"Failed to save settings: {e}")
+        )
+    
+    def _on_settings_saved(self, saved: bool):
+        """Report the outcome of a settings save."""
+        if not saved:
+            messagebox.showerror("Save Error", "Failed to save settings; see the log for details.")
+            return
+        
+        messagebox.showinfo("Success", "Settings saved successfully!")
+        self.status_label.configure(text="Settings saved successfully! ⚙️")
     
-    def _format_bytes(self, bytes_value: int) -> str:
-        """Format bytes to human readable string."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} PB"
+    def _on_close(self):
+        """Stop timers, animations and the background loop, then close."""
+        self._closing = True
+        if self._status_timer is not None:
+            self.root.after_cancel(self._status_timer)
+            self._status_timer = None
+        self.background_canvas.stop_animations()
+        
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if sys.version_info >= (3, 9):
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=False)
+        self.root.destroy()
     
     def run(self):
         """Run the GUI application."""
@@ -6,12 +6,17 @@ Aphrodite - goddess of love, beauty, and cleansing waters.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
+import functools
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 import json
 
-@dataclass
+from ..utils.compat import DATACLASS_SLOTS
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AphroditeColors:
     """Aphrodite-inspired color palette."""
     
@@ -50,13 +55,37 @@ class AphroditeColors:
     gradient_middle: str = "#4ECDC4"   # Azure
     gradient_end: str = "#A8A4CE"      # Lavender
 
+# The palette never changes, so every theme shares one instance
+COLORS = AphroditeColors()
+
 class AphroditeTheme:
     """Aphrodite-inspired theme for Purrify GUI."""
     
     def __init__(self):
-        self.colors = AphroditeColors()
+        self.colors = COLORS
         self.fonts = self._setup_fonts()
         self.styles = self._setup_styles()
+        
+        # Fixed color sets handed out to animations
+        self._gradient_colors = (
+            self.colors.gradient_start,
+            self.colors.gradient_middle,
+            self.colors.gradient_end
+        )
+        self._animation_colors = MappingProxyType({
+            'scanning': self.colors.primary_azure,
+            'cleaning': self.colors.primary_rose,
+            'optimizing': self.colors.secondary_gold,
+            'success': self.colors.success,
+            'warning': self.colors.warning,
+            'error': self.colors.error
+        })
+        self._status_colors = MappingProxyType({
+            'success': self.colors.success,
+            'warning': self.colors.warning,
+            'error': self.colors.error,
+            'normal': self.colors.primary_azure
+        })
     
     def _setup_fonts(self) -> Dict[str, Any]:
         """Setup beautiful fonts for the interface."""
@@ -68,6 +97,8 @@ class AphroditeTheme:
             'body_small': ('Helvetica Neue', 10, 'normal'),
             'button': ('Helvetica Neue', 12, 'bold'),
             'caption': ('Helvetica Neue', 9, 'normal'),
+            'icon_large': ('Arial', 24),
+            'icon_small': ('Arial', 16),
         }
     
     def _setup_styles(self) -> Dict[str, Any]:
@@ -107,7 +138,7 @@ class AphroditeTheme:
                 'cursor': 'hand2'
             },
             'button_ghost': {
-                'background': 'transparent',
+                'background': self.colors.bg_primary,
                 'foreground': self.colors.primary_rose,
                 'font': self.fonts['button'],
                 'relief': 'flat',
@@ -119,19 +150,19 @@ class AphroditeTheme:
                 'cursor': 'hand2'
             },
             'label_title': {
-                'background': 'transparent',
+                'background': self.colors.bg_primary,
                 'foreground': self.colors.text_primary,
                 'font': self.fonts['title'],
                 'justify': 'center'
             },
             'label_heading': {
-                'background': 'transparent',
+                'background': self.colors.bg_primary,
                 'foreground': self.colors.text_primary,
                 'font': self.fonts['heading'],
                 'justify': 'left'
             },
             'label_body': {
-                'background': 'transparent',
+                'background': self.colors.bg_primary,
                 'foreground': self.colors.text_secondary,
                 'font': self.fonts['body'],
                 'justify': 'left'
@@ -148,62 +179,112 @@ class AphroditeTheme:
         """Apply the Aphrodite theme to the root window."""
         root.configure(bg=self.colors.bg_primary)
         
-        # Configure ttk styles
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Configure common styles
-        style.configure('TFrame', background=self.colors.bg_primary)
-        style.configure('TLabel', background=self.colors.bg_primary, foreground=self.colors.text_primary)
-        style.configure('TButton', 
-                       background=self.colors.primary_rose,
-                       foreground=self.colors.text_white,
-                       font=self.fonts['button'],
-                       borderwidth=0,
-                       focuscolor='none')
-        
-        # Configure progress bar
-        style.configure('Aphrodite.Horizontal.TProgressbar',
-                       background=self.colors.primary_rose,
-                       troughcolor=self.colors.bg_secondary,
-                       borderwidth=0,
-                       lightcolor=self.colors.primary_rose,
-                       darkcolor=self.colors.primary_rose)
+        # Swap the font specs for named Tk fonts shared by every widget,
+        # and rebuild the styles that reference them
+        self.fonts = {
+            name: tkfont.Font(root=root, font=spec)
+            for name, spec in self.fonts.items()
+        }
+        self.styles = self._setup_styles()
         
-        # Configure entry
-        style.configure('TEntry',
-                       fieldbackground=self.colors.bg_secondary,
-                       foreground=self.colors.text_primary,
-                       borderwidth=1,
-                       relief='flat')
+        # Register every ttk style in one theme_create call
+        style = ttk.Style(root)
+        settings = self._ttk_settings()
+        if 'aphrodite' in style.theme_names():
+            style.theme_settings('aphrodite', settings)
+        else:
+            style.theme_create('aphrodite', parent='clam', settings=settings)
+        style.theme_use('aphrodite')
+    
+    def _ttk_settings(self) -> Dict[str, Any]:
+        """Build the ttk theme settings, keyed by style name."""
+        settings = {
+            # Common styles
+            'TFrame': {'configure': {'background': self.colors.bg_primary}},
+            'TLabel': {'configure': {'background': self.colors.bg_primary,
+                                     'foreground': self.colors.text_primary}},
+            'TButton': {'configure': {'background': self.colors.primary_rose,
+                                      'foreground': self.colors.text_white,
+                                      'font': self.fonts['button'],
+                                      'borderwidth': 0,
+                                      'focuscolor': 'none'}},
+            
+            # Progress bar
+            'Aphrodite.Horizontal.TProgressbar': {'configure': {
+                'background': self.colors.primary_rose,
+                'troughcolor': self.colors.bg_secondary,
+                'borderwidth': 0,
+                'lightcolor': self.colors.primary_rose,
+                'darkcolor': self.colors.primary_rose}},
+            
+            # Checkbuttons; they sit on cards
+            'Aphrodite.TCheckbutton': {
+                'configure': {'background': self.colors.bg_secondary,
+                              'foreground': self.colors.text_primary,
+                              'font': self.fonts['body'],
+                              'indicatorbackground': self.colors.bg_secondary,
+                              'indicatorforeground': self.colors.primary_rose,
+                              'focuscolor': 'none'},
+                'map': {'background': [('active', self.colors.bg_secondary)]}},
+            
+            # Entry
+            'TEntry': {'configure': {'fieldbackground': self.colors.bg_secondary,
+                                     'foreground': self.colors.text_primary,
+                                     'borderwidth': 1,
+                                     'relief': 'flat'}},
+            
+            # Treeview
+            'Treeview': {'configure': {'background': self.colors.bg_secondary,
+                                       'foreground': self.colors.text_primary,
+                                       'fieldbackground': self.colors.bg_secondary,
+                                       'borderwidth': 0}},
+            'Treeview.Heading': {'configure': {'background': self.colors.primary_lavender,
+                                               'foreground': self.colors.text_white,
+                                               'borderwidth': 0}},
+        }
         
-        # Configure treeview
-        style.configure('Treeview',
-                       background=self.colors.bg_secondary,
-                       foreground=self.colors.text_primary,
-                       fieldbackground=self.colors.bg_secondary,
-                       borderwidth=0)
+        # Buttons, one style per variant; hover colors are mapped to the
+        # 'active' state
+        for variant, hover in (
+            ('primary', {'background': [('active', self.colors.primary_lavender)]}),
+            ('secondary', {'background': [('active', self.colors.secondary_sage)]}),
+            ('ghost', {'background': [('active', self.colors.primary_rose)],
+                       'foreground': [('active', self.colors.text_white)]}),
+        ):
+            options = self.styles[f'button_{variant}']
+            settings[f'Aphrodite.{variant.capitalize()}.TButton'] = {
+                'configure': {
+                    'background': options['background'],
+                    'foreground': options['foreground'],
+                    'font': options['font'],
+                    'borderwidth': options['borderwidth'],
+                    'bordercolor': options.get('highlightbackground', options['background']),
+                    'relief': options['relief'],
+                    'padding': (options['padx'], options['pady']),
+                    'focuscolor': 'none',
+                },
+                'map': hover,
+            }
         
-        style.configure('Treeview.Heading',
-                       background=self.colors.primary_lavender,
-                       foreground=self.colors.text_white,
-                       borderwidth=0)
+        return settings
+    
+    def label_style(self, name: str, parent: tk.Misc) -> Dict[str, Any]:
+        """Options for a ``label_*`` style, on ``parent``'s background."""
+        return {**self.styles[name], 'background': parent.cget('bg')}
     
-    def get_gradient_colors(self) -> list:
+    def get_gradient_colors(self) -> Tuple[str, ...]:
         """Get gradient colors for animations."""
-        return [
-            self.colors.gradient_start,
-            self.colors.gradient_middle,
-            self.colors.gradient_end
-        ]
+        return self._gradient_colors
     
-    def get_animation_colors(self) -> Dict[str, str]:
-        """Get colors for specific animations."""
-        return {
-            'scanning': self.colors.primary_azure,
-            'cleaning': self.colors.primary_rose,
-            'optimizing': self.colors.secondary_gold,
-            'success': self.colors.success,
-            'warning': self.colors.warning,
-            'error': self.colors.error
-        } 
\ No newline at end of file
+    def get_animation_colors(self) -> Mapping[str, str]:
+        """Get colors for specific animations (read-only)."""
+        return self._animation_colors
+    
+    def get_status_colors(self) -> Mapping[str, str]:
+        """Get status indicator colors (read-only)."""
+        return self._status_colors
+
+@functools.lru_cache(maxsize=1)
+def get_theme() -> AphroditeTheme:
+    """Return the shared theme instance used by every widget."""
+    return AphroditeTheme()
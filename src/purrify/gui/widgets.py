@@ -8,111 +8,90 @@ design and fluid animations.
 import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Optional, Dict, Any
-from .styles import AphroditeTheme
-from .animations import FluidAnimations, ProgressAnimation
+from .styles import get_theme
+from .animations import FluidAnimations, ProgressAnimation, _blend_colors
 
-class AphroditeButton(tk.Button):
-    """Beautiful button with Aphrodite-inspired design."""
+# Click ripple: frames fading from pearl into the pressed button color
+RIPPLE_STEPS = 20
+RIPPLE_FRAME_MS = 20
+
+class AphroditeButton(ttk.Button):
+    """
+    Beautiful button with Aphrodite-inspired design.
+    
+    Colors, font, padding and hover effects come from the
+    ``Aphrodite.<Style>.TButton`` styles registered by
+    ``AphroditeTheme.apply_theme``. The click ripple fades a highlight
+    out of the button's own background through a per-button derived
+    style, so the label stays visible and later clicks reach the button.
+    """
     
     def __init__(self, parent, text: str, command: Callable = None, 
                  style: str = "primary", **kwargs):
-        self.theme = AphroditeTheme()
-        self.style = style
+        self.theme = get_theme()
+        self.variant = style
+        self._base_style = f"Aphrodite.{style.capitalize()}.TButton"
         
-        # Get button style
-        button_style = self.theme.styles[f'button_{style}']
+        # Inherits everything from the variant style; it only gets its
+        # own background map while a ripple plays
+        self._ripple_style = f"Ripple{id(self)}.{self._base_style}"
         
         super().__init__(
             parent,
             text=text,
             command=command,
-            **button_style,
+            style=self._ripple_style,
+            cursor=self.theme.styles[f'button_{style}']['cursor'],
             **kwargs
         )
         
-        # Bind hover effects
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
+        self._style = ttk.Style(self)
+        self._ripple_after = None
+        
+        # Ripple on click
         self.bind("<Button-1>", self._on_click)
     
-    def _on_enter(self, event):
-        """Handle mouse enter event."""
-        if self.style == "primary":
-            self.configure(background=self.theme.colors.primary_lavender)
-        elif self.style == "secondary":
-            self.configure(background=self.theme.colors.secondary_sage)
-        else:  # ghost
-            self.configure(background=self.theme.colors.primary_rose, 
-                          foreground=self.theme.colors.text_white)
-    
-    def _on_leave(self, event):
-        """Handle mouse leave event."""
-        if self.style == "primary":
-            self.configure(background=self.theme.colors.primary_rose)
-        elif self.style == "secondary":
-            self.configure(background=self.theme.colors.primary_azure)
-        else:  # ghost
-            self.configure(background="transparent", 
-                          foreground=self.theme.colors.primary_rose)
-    
     def _on_click(self, event):
         """Handle click event with ripple effect."""
-        # Create ripple effect
-        x, y = event.x, event.y
-        canvas = tk.Canvas(self, width=self.winfo_width(), height=self.winfo_height(),
-                          bg="transparent", highlightthickness=0)
-        canvas.place(x=0, y=0)
+        # Restart any ripple still playing
+        if self._ripple_after is not None:
+            self.after_cancel(self._ripple_after)
         
         # Animate ripple
-        self._animate_ripple(canvas, x, y)
+        self._animate_ripple()
     
-    def _animate_ripple(self, canvas: tk.Canvas, x: int, y: int):
-        """Animate ripple effect on button click."""
-        radius = 0
-        max_radius = max(self.winfo_width(), self.winfo_height())
+    def _animate_ripple(self):
+        """Animate the ripple highlight on button click."""
+        style = self._style
+        target = (
+            style.lookup(self._base_style, 'background', ('active',))
+            or self.theme.styles[f'button_{self.variant}']['background']
+        )
+        frames = [
+            _blend_colors(self.theme.colors.primary_pearl, target, step / RIPPLE_STEPS)
+            for step in range(RIPPLE_STEPS)
+        ]
+        
+        index = 0
         
         def animate():
-            nonlocal radius
-            if radius < max_radius:
-                canvas.delete("ripple")
-                alpha = 1.0 - (radius / max_radius)
-                # Create a simple color adjustment for the ripple effect
-                color = self._adjust_color_alpha_simple(self.theme.colors.primary_pearl, alpha)
-                
-                canvas.create_oval(
-                    x - radius, y - radius,
-                    x + radius, y + radius,
-                    outline=color,
-                    width=2,
-                    tags="ripple"
-                )
-                
-                radius += 5
-                canvas.after(20, animate)
+            nonlocal index
+            if index < len(frames):
+                # '!disabled' covers the normal, hover and pressed states
+                style.map(self._ripple_style, background=[('!disabled', frames[index])])
+                index += 1
+                self._ripple_after = self.after(RIPPLE_FRAME_MS, animate)
             else:
-                canvas.destroy()
+                self._ripple_after = None
+                style.map(self._ripple_style, background=[])
         
         animate()
-    
-    def _adjust_color_alpha_simple(self, color: str, alpha: float) -> str:
-        """Simple color alpha adjustment for button ripples."""
-        # Convert hex to RGB
-        r = int(color[1:3], 16)
-        g = int(color[3:5], 16)
-        b = int(color[5:7], 16)
-        
-        # Apply alpha
-        r = int(r * alpha)
-        g = int(g * alpha)
-        b = int(b * alpha)
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
 
 class AphroditeCard(tk.Frame):
     """Beautiful card widget with rounded corners and shadow."""
     
     def __init__(self, parent, title: str = "", **kwargs):
-        self.theme = AphroditeTheme()
+        self.theme = get_theme()
         
         super().__init__(
             parent,
@@ -125,7 +104,7 @@ class AphroditeCard(tk.Frame):
             self.title_label = tk.Label(
                 self,
                 text=title,
-                **self.theme.styles['label_heading']
+                **self.theme.label_style('label_heading', self)
             )
             self.title_label.pack(pady=(10, 5), padx=10, anchor="w")
     
@@ -137,7 +116,7 @@ class AphroditeProgressBar(tk.Frame):
     """Beautiful animated progress bar."""
     
     def __init__(self, parent, **kwargs):
-        self.theme = AphroditeTheme()
+        self.theme = get_theme()
         
         super().__init__(parent, **kwargs)
         
@@ -157,15 +136,23 @@ class AphroditeProgressBar(tk.Frame):
         self.progress_text = tk.Label(
             self,
             text="0%",
-            **self.theme.styles['label_body']
+            **self.theme.label_style('label_body', self)
         )
         self.progress_text.pack(pady=(0, 5))
         
         # Bind resize event
         self.canvas.bind("<Configure>", self._on_resize)
+        
+        # Last value and percentage shown, to skip no-op updates
+        self._last_value = -1.0
+        self._last_percentage = 0
     
     def set_progress(self, value: float, animate: bool = True):
         """Set progress value (0.0 to 1.0)."""
+        if abs(value - self._last_value) < 0.005:
+            return
+        self._last_value = value
+        
         if animate:
             self.progress_anim.animate_progress(value)
         else:
@@ -174,7 +161,9 @@ class AphroditeProgressBar(tk.Frame):
         
         # Update text
         percentage = int(value * 100)
-        self.progress_text.configure(text=f"{percentage}%")
+        if percentage != self._last_percentage:
+            self._last_percentage = percentage
+            self.progress_text.configure(text=f"{percentage}%")
     
     def _on_resize(self, event):
         """Handle canvas resize."""
@@ -185,7 +174,7 @@ class AphroditeStatusCard(tk.Frame):
     
     def __init__(self, parent, title: str, value: str, icon: str = "✨", 
                  status: str = "normal", **kwargs):
-        self.theme = AphroditeTheme()
+        self.theme = get_theme()
         
         super().__init__(
             parent,
@@ -197,8 +186,8 @@ class AphroditeStatusCard(tk.Frame):
         icon_label = tk.Label(
             self,
             text=icon,
-            font=("Arial", 24),
-            bg="transparent",
+            font=self.theme.fonts['icon_large'],
+            bg=self.cget('bg'),
             fg=self.theme.colors.primary_rose
         )
         icon_label.pack(pady=(10, 5))
@@ -206,7 +195,7 @@ class AphroditeStatusCard(tk.Frame):
         title_label = tk.Label(
             self,
             text=title,
-            **self.theme.styles['label_body']
+            **self.theme.label_style('label_body', self)
         )
         title_label.pack(pady=(0, 5))
         
@@ -214,17 +203,12 @@ class AphroditeStatusCard(tk.Frame):
         self.value_label = tk.Label(
             self,
             text=value,
-            **self.theme.styles['label_heading']
+            **self.theme.label_style('label_heading', self)
         )
         self.value_label.pack(pady=(0, 10))
         
         # Status indicator
-        self.status_colors = {
-            'success': self.theme.colors.success,
-            'warning': self.theme.colors.warning,
-            'error': self.theme.colors.error,
-            'normal': self.theme.colors.primary_azure
-        }
+        self.status_colors = self.theme.get_status_colors()
         
         self.status_indicator = tk.Frame(
             self,
@@ -233,13 +217,23 @@ class AphroditeStatusCard(tk.Frame):
             bg=self.status_colors.get(status, self.theme.colors.primary_azure)
         )
         self.status_indicator.pack(pady=(0, 10))
+        
+        # Last shown value and status, to skip no-op reconfigures
+        self._value = value
+        self._status = status
     
     def update_value(self, value: str):
         """Update the value display."""
+        if value == self._value:
+            return
+        self._value = value
         self.value_label.configure(text=value)
     
     def update_status(self, status: str):
         """Update the status indicator."""
+        if status == self._status:
+            return
+        self._status = status
         color = self.status_colors.get(status, self.theme.colors.primary_azure)
         self.status_indicator.configure(bg=color)
 
@@ -247,7 +241,7 @@ class AphroditeAnimatedCanvas(tk.Canvas):
     """Canvas with built-in fluid animations."""
     
     def __init__(self, parent, **kwargs):
-        self.theme = AphroditeTheme()
+        self.theme = get_theme()
         
         super().__init__(
             parent,
@@ -258,6 +252,15 @@ class AphroditeAnimatedCanvas(tk.Canvas):
         
         # Initialize animations
         self.animations = FluidAnimations(self, self.theme)
+        self._enabled = True
+        
+        # Single background item, resized in place
+        self._background = self.create_rectangle(
+            0, 0, 0, 0,
+            fill=self.theme.colors.bg_primary,
+            outline="",
+            tags="background"
+        )
         
         # Bind events
         self.bind("<Button-1>", self._on_click)
@@ -265,7 +268,8 @@ class AphroditeAnimatedCanvas(tk.Canvas):
     
     def start_water_flow(self):
         """Start water flow animation."""
-        self.animations.start_water_flow()
+        if self._enabled:
+            self.animations.start_water_flow()
     
     def start_cleansing_waves(self):
         """Start cleansing waves animation."""
@@ -279,26 +283,35 @@ class AphroditeAnimatedCanvas(tk.Canvas):
         """Stop all animations."""
         self.animations.stop_animations()
     
+    def set_animation_enabled(self, enabled: bool):
+        """Pause the water flow while the canvas is covered, resume it after."""
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+        if enabled:
+            self.animations.start_water_flow()
+        else:
+            self.animations.stop_animations()
+    
+    def set_max_fps(self, max_fps: int):
+        """Limit the animation frame rate."""
+        self.animations.set_max_fps(max_fps)
+    
     def _on_click(self, event):
         """Handle canvas click with ripple effect."""
         self.animations.start_ripple_effect(event.x, event.y)
     
     def _on_resize(self, event):
         """Handle canvas resize."""
-        # Redraw background
-        self.delete("background")
-        self.create_rectangle(
-            0, 0, event.width, event.height,
-            fill=self.theme.colors.bg_primary,
-            outline="",
-            tags="background"
-        )
+        # Resize background, keeping it beneath the animation items
+        self.coords(self._background, 0, 0, event.width, event.height)
+        self.tag_lower(self._background)
 
 class AphroditeMenuBar(tk.Frame):
     """Beautiful menu bar with Aphrodite design."""
     
     def __init__(self, parent, **kwargs):
-        self.theme = AphroditeTheme()
+        self.theme = get_theme()
         
         super().__init__(
             parent,
@@ -323,54 +336,48 @@ class AphroditeMenuBar(tk.Frame):
         )
         item_frame.pack(side="left", padx=5, pady=10)
         
+        labels = []
+        
         # Icon
         if icon:
             icon_label = tk.Label(
                 item_frame,
                 text=icon,
-                font=("Arial", 16),
-                bg="transparent",
+                font=self.theme.fonts['icon_small'],
+                bg=item_frame.cget('bg'),
                 fg=self.theme.colors.text_secondary
             )
             icon_label.pack()
+            labels.append(icon_label)
         
         # Text
         text_label = tk.Label(
             item_frame,
             text=text,
-            **self.theme.styles['label_body']
+            **self.theme.label_style('label_body', item_frame)
         )
         text_label.pack()
+        labels.append(text_label)
         
-        # Bind events
-        item_frame.bind("<Enter>", lambda e, f=item_frame: self._on_item_enter(f))
-        item_frame.bind("<Leave>", lambda e, f=item_frame: self._on_item_leave(f))
-        item_frame.bind("<Button-1>", lambda e, cmd=command: self._on_item_click(cmd))
-        
-        text_label.bind("<Enter>", lambda e, f=item_frame: self._on_item_enter(f))
-        text_label.bind("<Leave>", lambda e, f=item_frame: self._on_item_leave(f))
-        text_label.bind("<Button-1>", lambda e, cmd=command: self._on_item_click(cmd))
-        
-        if icon:
-            icon_label.bind("<Enter>", lambda e, f=item_frame: self._on_item_enter(f))
-            icon_label.bind("<Leave>", lambda e, f=item_frame: self._on_item_leave(f))
-            icon_label.bind("<Button-1>", lambda e, cmd=command: self._on_item_click(cmd))
+        # Bind events; hover handlers get the labels directly
+        for widget in (item_frame, *labels):
+            widget.bind("<Enter>", lambda e, f=item_frame, l=labels: self._on_item_enter(f, l))
+            widget.bind("<Leave>", lambda e, f=item_frame, l=labels: self._on_item_leave(f, l))
+            widget.bind("<Button-1>", lambda e, cmd=command: self._on_item_click(cmd))
         
-        self.menu_items[text] = item_frame
+        self.menu_items[text] = (item_frame, labels)
     
-    def _on_item_enter(self, item_frame):
+    def _on_item_enter(self, item_frame, labels):
         """Handle menu item enter."""
         item_frame.configure(bg=self.theme.colors.bg_accent)
-        for child in item_frame.winfo_children():
-            if isinstance(child, tk.Label):
-                child.configure(fg=self.theme.colors.primary_rose)
+        for label in labels:
+            label.configure(bg=self.theme.colors.bg_accent, fg=self.theme.colors.primary_rose)
     
-    def _on_item_leave(self, item_frame):
+    def _on_item_leave(self, item_frame, labels):
         """Handle menu item leave."""
         item_frame.configure(bg=self.theme.colors.bg_secondary)
-        for child in item_frame.winfo_children():
-            if isinstance(child, tk.Label):
-                child.configure(fg=self.theme.colors.text_secondary)
+        for label in labels:
+            label.configure(bg=self.theme.colors.bg_secondary, fg=self.theme.colors.text_secondary)
     
     def _on_item_click(self, command):
         """Handle menu item click."""
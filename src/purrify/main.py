@@ -9,31 +9,41 @@ for the Purrify system optimization utility.
 import sys
 import asyncio
 import click
-from pathlib import Path
 from typing import Optional
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Purrify modules are imported inside the commands that need them, so
+# ``--help`` and ``--version`` return without loading the engine
 
-from purrify.core.engine import PurrifyEngine
-from purrify.core.config import Config
-from purrify.core.logger import setup_logger
-from purrify.utils.platform import detect_platform
-from purrify.utils.cli_utils import print_banner, print_system_info
+
+def _close_loop(loop: asyncio.AbstractEventLoop):
+    """Finish the loop's async generators and executor work, then close it."""
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        if sys.version_info >= (3, 9):
+            loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
 
 
 @click.group()
 @click.version_option(version="1.0.0", prog_name="Purrify")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 @click.option("--config", "-c", type=click.Path(exists=True), help="Path to config file")
+@click.option("--refresh-platform", is_flag=True, help="Re-detect platform info instead of using the cached copy")
 @click.pass_context
-def cli(ctx, verbose: bool, config: Optional[str]):
+def cli(ctx, verbose: bool, config: Optional[str], refresh_platform: bool):
     """
     🐱 Purrify - AI-Driven System Optimization Utility
     
     Clean caches, optimize files, and improve system performance
     using intelligent AI-powered analysis.
     """
+    from purrify.core.config import Config
+    from purrify.core.logger import setup_logger
+    from purrify.utils.platform import detect_platform, clear_platform_cache
+    from purrify.utils.cli_utils import print_banner, print_system_info
+    
     # Ensure context object exists
     ctx.ensure_object(dict)
     
@@ -44,10 +54,18 @@ def cli(ctx, verbose: bool, config: Optional[str]):
     config_path = config or "config/purrify.yaml"
     ctx.obj["config"] = Config(config_path)
     
+    # One event loop for whatever the invoked commands run
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    ctx.obj["loop"] = loop
+    ctx.call_on_close(lambda: _close_loop(loop))
+    
     # Print banner
     print_banner()
     
     # Detect and display platform info
+    if refresh_platform:
+        clear_platform_cache()
     platform_info = detect_platform()
     print_system_info(platform_info)
 
@@ -67,6 +85,8 @@ def scan(ctx, quick: bool, detailed: bool, duplicates: bool, photos: bool, large
     Analyzes your system to identify caches, temporary files, duplicates,
     photos, and optimization opportunities.
     """
+    from purrify.core.engine import PurrifyEngine
+    
     config = ctx.obj["config"]
     engine = PurrifyEngine(config)
     
@@ -79,7 +99,7 @@ def scan(ctx, quick: bool, detailed: bool, duplicates: bool, photos: bool, large
         include_large_files = large_files or (not quick and not detailed)
         
         # Run enhanced system scan
-        scan_results = asyncio.run(engine.scan_system(
+        scan_results = ctx.obj["loop"].run_until_complete(engine.scan_system(
             quick_mode=quick,
             detailed_mode=detailed,
             include_duplicates=include_duplicates,
@@ -109,6 +129,8 @@ def clean(ctx, all: bool, caches: bool, logs: bool, temp: bool, safe: bool, back
     
     Removes unnecessary files to free up disk space and improve performance.
     """
+    from purrify.core.engine import PurrifyEngine
+    
     config = ctx.obj["config"]
     engine = PurrifyEngine(config)
     
@@ -127,7 +149,7 @@ def clean(ctx, all: bool, caches: bool, logs: bool, temp: bool, safe: bool, back
     
     try:
         # Run cleaning operation
-        clean_results = asyncio.run(engine.clean_system(
+        clean_results = ctx.obj["loop"].run_until_complete(engine.clean_system(
             clean_options=clean_options,
             safe_mode=safe,
             create_backup=backup
@@ -154,17 +176,20 @@ def optimize(ctx, startup: bool, memory: bool, disk: bool, all: bool, safe: bool
     
     Applies various optimizations to improve system speed and efficiency.
     """
+    from purrify.core.engine import PurrifyEngine
+    from purrify.optimizers import OptimizeOptions
+    
     config = ctx.obj["config"]
     engine = PurrifyEngine(config)
     
     # Determine optimization options
-    opt_options = {
-        "startup": all or startup,
-        "memory": all or memory,
-        "disk": all or disk,
-    }
+    opt_options = OptimizeOptions(
+        startup=all or startup,
+        memory=all or memory,
+        disk=all or disk,
+    )
     
-    if not any(opt_options.values()):
+    if not opt_options.selected():
         click.echo("❌ Please specify optimization type. Use --help for options.")
         return
     
@@ -172,7 +197,7 @@ def optimize(ctx, startup: bool, memory: bool, disk: bool, all: bool, safe: bool
     
     try:
         # Run optimization
-        opt_results = asyncio.run(engine.optimize_system(
+        opt_results = ctx.obj["loop"].run_until_complete(engine.optimize_system(
             optimization_options=opt_options,
             safe_mode=safe
         ))
@@ -195,6 +220,8 @@ def report(ctx, detailed: bool, output: Optional[str]):
     
     Creates a comprehensive report of system status and optimization history.
     """
+    from purrify.core.engine import PurrifyEngine
+    
     config = ctx.obj["config"]
     engine = PurrifyEngine(config)
     
@@ -202,7 +229,7 @@ def report(ctx, detailed: bool, output: Optional[str]):
     
     try:
         # Generate report
-        report_data = asyncio.run(engine.generate_report(detailed=detailed))
+        report_data = ctx.obj["loop"].run_until_complete(engine.generate_report(detailed=detailed))
         
         # Display or save report
         engine.display_report(report_data, output_file=output)
@@ -231,17 +258,20 @@ def gui():
 
 
 @cli.command()
-def status():
+@click.pass_context
+def status(ctx):
     """
     📈 Show system status
     
     Displays current system status and optimization metrics.
     """
-    config = Config()
+    from purrify.core.engine import PurrifyEngine
+    
+    config = ctx.obj["config"]
     engine = PurrifyEngine(config)
     
     try:
-        status_info = asyncio.run(engine.get_system_status())
+        status_info = ctx.obj["loop"].run_until_complete(engine.get_system_status())
         engine.display_system_status(status_info)
     except Exception as e:
         click.echo(f"❌ Status check failed: {e}", err=True)
@@ -5,6 +5,6 @@ This package contains system optimization modules for improving
 performance, managing startup items, and optimizing system resources.
 """
 
-from .performance_optimizer import PerformanceOptimizer
+from .performance_optimizer import PerformanceOptimizer, OptimizeOptions, OptimizationResult
 
-__all__ = ["PerformanceOptimizer"] 
\ No newline at end of file
+__all__ = ["PerformanceOptimizer", "OptimizeOptions", "OptimizationResult"] 
\ No newline at end of file
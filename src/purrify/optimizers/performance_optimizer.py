@@ -6,29 +6,39 @@ including startup management, memory optimization, and disk optimization.
 """
 
 import asyncio
+import itertools
 import time
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from typing import Any, List
+from dataclasses import dataclass, field
 from loguru import logger
 
 from ..core.config import Config
 from ..core.logger import log_async_function_call
+from ..utils.compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class OptimizeOptions:
+    """Which optimizations to apply."""
+    startup: bool = False
+    memory: bool = False
+    disk: bool = False
+    
+    def selected(self) -> bool:
+        """Whether any optimization is selected."""
+        return self.startup or self.memory or self.disk
+
+
+@dataclass(**DATACLASS_SLOTS)
 class OptimizationResult:
     """Results from an optimization operation."""
     optimizations_applied: int = 0
-    performance_improvement: float = 0.0
+    performance_improvement: float = 0.0  # percentage
     optimization_duration: float = 0.0
-    optimization_errors: List[str] = None
+    optimization_errors: List[str] = field(default_factory=list)
     startup_items_optimized: int = 0
     memory_optimized: bool = False
     disk_optimized: bool = False
-    
-    def __post_init__(self):
-        if self.optimization_errors is None:
-            self.optimization_errors = []
 
 
 class PerformanceOptimizer:
@@ -54,43 +64,56 @@ class PerformanceOptimizer:
     @log_async_function_call
     async def optimize_system(
         self,
-        optimization_options: Dict[str, bool],
+        optimization_options: OptimizeOptions,
         safe_mode: bool = True
     ) -> OptimizationResult:
         """
         Optimize system performance based on specified options.
         
         Args:
-            optimization_options: Dictionary specifying optimization types
+            optimization_options: Which optimizations to apply
             safe_mode: Enable safe mode (preview only)
             
         Returns:
             OptimizationResult object containing optimization results
         """
-        logger.info(f"Starting system optimization (safe_mode: {safe_mode})")
+        # Nothing selected, nothing to time or log
+        if not optimization_options.selected():
+            return OptimizationResult()
         
-        opt_start = time.time()
+        logger.info("Starting system optimization (safe_mode: {})", safe_mode)
+        
+        opt_start = time.monotonic()
         optimizations_applied = 0
         optimization_errors = []
         
         try:
-            # Apply different optimizations
-            if optimization_options.get("startup", False):
-                result = await self._optimize_startup(safe_mode)
-                optimizations_applied += result.optimizations_applied
-                optimization_errors.extend(result.optimization_errors)
+            # The optimizations touch separate subsystems, so run them together
+            tasks = []
+            if optimization_options.startup:
+                tasks.append(self._optimize_startup(safe_mode))
+            
+            if optimization_options.memory:
+                tasks.append(self._optimize_memory(safe_mode))
             
-            if optimization_options.get("memory", False):
-                result = await self._optimize_memory(safe_mode)
-                optimizations_applied += result.optimizations_applied
-                optimization_errors.extend(result.optimization_errors)
+            if optimization_options.disk:
+                tasks.append(self._optimize_disk(safe_mode))
             
-            if optimization_options.get("disk", False):
-                result = await self._optimize_disk(safe_mode)
-                optimizations_applied += result.optimizations_applied
-                optimization_errors.extend(result.optimization_errors)
+            # A failing optimization is reported without dropping the others
+            completed = []
+            for result in await asyncio.gather(*tasks, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Optimization step failed: {result}")
+                    optimization_errors.append(str(result))
+                else:
+                    completed.append(result)
+            
+            optimizations_applied = sum(r.optimizations_applied for r in completed)
+            optimization_errors.extend(
+                itertools.chain.from_iterable(r.optimization_errors for r in completed)
+            )
             
-            opt_duration = time.time() - opt_start
+            opt_duration = time.monotonic() - opt_start
             
             # Calculate performance improvement (placeholder)
             performance_improvement = min(optimizations_applied * 2.5, 25.0)
@@ -102,8 +125,8 @@ class PerformanceOptimizer:
                 optimization_errors=optimization_errors
             )
             
-            logger.info(f"System optimization completed in {opt_duration:.2f}s")
-            logger.info(f"Applied {optimizations_applied} optimizations")
+            logger.info("System optimization completed in {:.2f}s", opt_duration)
+            logger.info("Applied {} optimizations", optimizations_applied)
             
             return result
             
@@ -112,7 +135,7 @@ class PerformanceOptimizer:
             optimization_errors.append(str(e))
             return OptimizationResult(
                 optimization_errors=optimization_errors,
-                optimization_duration=time.time() - opt_start
+                optimization_duration=time.monotonic() - opt_start
             )
     
     async def _optimize_startup(self, safe_mode: bool) -> OptimizationResult:
@@ -10,32 +10,136 @@ import os
 import time
 import hashlib
 import mimetypes
-from pathlib import Path
-from typing import Dict, Any, List, Optional, Set, Tuple
+import re
+import stat
+from pathlib import Path, PurePath
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
 from loguru import logger
 import json
 
+try:
+    import blake3
+except ImportError:  # optional, hashlib is used instead
+    blake3 = None
+
 from ..core.config import Config
 from ..utils.platform import get_system_paths, get_browser_paths, format_bytes
+from ..utils.compat import to_thread
 from ..core.logger import log_async_function_call
 
 
-@dataclass
+# Read size used when hashing files for duplicate detection
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Consumers and queue bound for the producer/consumer directory walker
+WALK_WORKERS = 8
+WALK_QUEUE_SIZE = 1024
+
+# Path fragments that raise the risk of deleting a file, matched against
+# the lowercased path
+HIGH_RISK_PATTERNS = (
+    "system", "library", "bin", "sbin", "usr/bin", "usr/sbin",
+    "windows", "system32", "syswow64", "program files"
+)
+MEDIUM_RISK_PATTERNS = (
+    "application support", "preferences", "settings",
+    "appdata", "local", "roaming"
+)
+
+# Compiled once so each path is scanned in a single regex pass
+_HIGH_RISK_RE = re.compile("|".join(map(re.escape, HIGH_RISK_PATTERNS)))
+_MEDIUM_RISK_RE = re.compile("|".join(map(re.escape, MEDIUM_RISK_PATTERNS)))
+
+
+def _list_directory(path: str) -> List[os.DirEntry]:
+    """Read all entries of a directory (run in a worker thread)."""
+    with os.scandir(path) as it:
+        return list(it)
+
+
+def _collect_system_status() -> Dict[str, Any]:
+    """Take a full psutil status snapshot (run in a worker thread)."""
+    import psutil
+    
+    # Get system information
+    cpu_percent = psutil.cpu_percent(interval=1)
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage('/')
+    
+    # Get process information
+    processes = len(psutil.pids())
+    
+    # Get network information
+    network = psutil.net_io_counters()
+    
+    return {
+        "cpu_usage_percent": cpu_percent,
+        "memory_total_bytes": memory.total,
+        "memory_used_bytes": memory.used,
+        "memory_available_bytes": memory.available,
+        "memory_percent_used": memory.percent,
+        "disk_total_bytes": disk.total,
+        "disk_used_bytes": disk.used,
+        "disk_free_bytes": disk.free,
+        "disk_percent_used": disk.percent,
+        "process_count": processes,
+        "network_bytes_sent": network.bytes_sent,
+        "network_bytes_recv": network.bytes_recv,
+        "timestamp": time.time()
+    }
+
+
 class FileInfo:
-    """Information about a file found during scanning."""
-    path: str
-    size: int
-    modified: float
-    file_type: str
-    category: str
-    safe_to_delete: bool = True
-    risk_level: str = "low"
-    hash: Optional[str] = None
-    duplicate_group: Optional[str] = None
-    photo_metadata: Optional[Dict] = None
-    compression_potential: Optional[float] = None
+    """
+    Information about a file found during scanning.
+    
+    One instance is kept per scanned file, so the class declares
+    ``__slots__`` by hand to drop the per-instance ``__dict__`` on every
+    supported Python (``dataclass(slots=True)`` needs 3.10).
+    """
+    __slots__ = (
+        "path", "size", "modified", "file_type", "category", "safe_to_delete",
+        "risk_level", "hash", "duplicate_group", "photo_metadata", "compression_potential"
+    )
+    
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        modified: float,
+        file_type: str,
+        category: str,
+        safe_to_delete: bool = True,
+        risk_level: str = "low",
+        hash: Optional[str] = None,
+        duplicate_group: Optional[str] = None,
+        photo_metadata: Optional[Dict] = None,
+        compression_potential: Optional[float] = None
+    ):
+        self.path = path
+        self.size = size
+        self.modified = modified
+        self.file_type = file_type
+        self.category = category
+        self.safe_to_delete = safe_to_delete
+        self.risk_level = risk_level
+        self.hash = hash
+        self.duplicate_group = duplicate_group
+        self.photo_metadata = photo_metadata
+        self.compression_potential = compression_potential
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"FileInfo({fields})"
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    __hash__ = None  # mutable, like the dataclass it replaces
 
 
 @dataclass
@@ -80,11 +184,17 @@ class SystemScanner:
         self.platform = config.platform
         self.system_paths = get_system_paths()
         self.browser_paths = get_browser_paths()
+        self.home = os.path.expanduser("~")
+        self.hash_algo = self._resolve_hash_algo(config.scanning.hash_algo)
         
         # Track scanned files
         self.scanned_files: List[FileInfo] = []
         self.scan_errors: List[str] = []
         
+        # Roots already walked by _scan_directory, mapped to their
+        # (max depth, category)
+        self._scanned_roots: Dict[str, Tuple[int, str]] = {}
+        
         # Enhanced tracking
         self.duplicate_groups: List[DuplicateGroup] = []
         self.photo_analysis: List[PhotoAnalysis] = []
@@ -125,6 +235,7 @@ class SystemScanner:
         # Reset tracking
         self.scanned_files.clear()
         self.scan_errors.clear()
+        self._scanned_roots.clear()
         self.duplicate_groups.clear()
         self.photo_analysis.clear()
         self.large_files.clear()
@@ -309,41 +420,44 @@ class SystemScanner:
         logger.debug("Scanning for duplicate files...")
         
         # Common directories to scan for duplicates
-        duplicate_paths = [
-            os.path.expanduser("~/Downloads"),
-            os.path.expanduser("~/Desktop"),
-            os.path.expanduser("~/Documents"),
-            os.path.expanduser("~/Pictures"),
-            os.path.expanduser("~/Music"),
-            os.path.expanduser("~/Videos")
-        ]
+        duplicate_paths = self._home_dirs("Downloads", "Desktop", "Documents", "Pictures", "Music", "Videos")
         
         for path in duplicate_paths:
-            if os.path.exists(path):
-                try:
-                    await self._scan_directory_for_duplicates(path, max_depth=5)
-                except Exception as e:
-                    error_msg = f"Failed to scan for duplicates in {path}: {e}"
-                    logger.warning(error_msg)
-                    self.scan_errors.append(error_msg)
+            try:
+                await self._scan_directory_for_duplicates(path, max_depth=5)
+            except Exception as e:
+                error_msg = f"Failed to scan for duplicates in {path}: {e}"
+                logger.warning(error_msg)
+                self.scan_errors.append(error_msg)
+
+    def _home_dirs(self, *names: str) -> List[str]:
+        """
+        Return the paths of the named directories that exist in the home directory.
+        
+        The home directory is listed once rather than checking every
+        candidate path separately.
+        """
+        try:
+            with os.scandir(self.home) as it:
+                present = {entry.name for entry in it if entry.is_dir()}
+        except OSError as e:
+            logger.debug(f"Error listing home directory {self.home}: {e}")
+            return []
+        
+        return [os.path.join(self.home, name) for name in names if name in present]
 
     async def _scan_directory_for_duplicates(self, path: str, max_depth: int = 3):
         """Scan directory for potential duplicate files."""
+        async def handle(entry: os.DirEntry):
+            st = entry.stat()
+            if not stat.S_ISREG(st.st_mode) or st.st_size <= 1024:  # Only files > 1KB
+                return
+            file_info = await self._get_enhanced_file_info(entry.path, "potential_duplicate", st)
+            if file_info:
+                self.scanned_files.append(file_info)
+        
         try:
-            for root, dirs, files in os.walk(path):
-                depth = root[len(path):].count(os.sep)
-                if depth > max_depth:
-                    continue
-                
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        file_info = await self._get_enhanced_file_info(file_path, "potential_duplicate")
-                        if file_info and file_info.size > 1024:  # Only files > 1KB
-                            self.scanned_files.append(file_info)
-                    except Exception as e:
-                        logger.debug(f"Error processing file {file_path}: {e}")
-                        
+            await self._walk_files(path, max_depth, handle)
         except Exception as e:
             logger.warning(f"Error scanning directory {path}: {e}")
 
@@ -351,42 +465,30 @@ class SystemScanner:
         """Scan for photos and analyze them."""
         logger.debug("Scanning for photos...")
         
-        photo_paths = [
-            os.path.expanduser("~/Pictures"),
-            os.path.expanduser("~/Downloads"),
-            os.path.expanduser("~/Desktop"),
-            os.path.expanduser("~/Documents")
-        ]
+        photo_paths = self._home_dirs("Pictures", "Downloads", "Desktop", "Documents")
         
         for path in photo_paths:
-            if os.path.exists(path):
-                try:
-                    await self._scan_directory_for_photos(path, max_depth=6)
-                except Exception as e:
-                    error_msg = f"Failed to scan for photos in {path}: {e}"
-                    logger.warning(error_msg)
-                    self.scan_errors.append(error_msg)
+            try:
+                await self._scan_directory_for_photos(path, max_depth=6)
+            except Exception as e:
+                error_msg = f"Failed to scan for photos in {path}: {e}"
+                logger.warning(error_msg)
+                self.scan_errors.append(error_msg)
 
     async def _scan_directory_for_photos(self, path: str, max_depth: int = 4):
         """Scan directory for photos."""
+        async def handle(entry: os.DirEntry):
+            file_ext = os.path.splitext(entry.name)[1].lower()
+            if file_ext in self.photo_extensions:
+                st = entry.stat()
+                if not stat.S_ISREG(st.st_mode):
+                    return
+                file_info = await self._get_enhanced_file_info(entry.path, "photo", st)
+                if file_info:
+                    self.scanned_files.append(file_info)
+        
         try:
-            for root, dirs, files in os.walk(path):
-                depth = root[len(path):].count(os.sep)
-                if depth > max_depth:
-                    continue
-                
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    file_ext = Path(file).suffix.lower()
-                    
-                    if file_ext in self.photo_extensions:
-                        try:
-                            file_info = await self._get_enhanced_file_info(file_path, "photo")
-                            if file_info:
-                                self.scanned_files.append(file_info)
-                        except Exception as e:
-                            logger.debug(f"Error processing photo {file_path}: {e}")
-                            
+            await self._walk_files(path, max_depth, handle)
         except Exception as e:
             logger.warning(f"Error scanning photos in {path}: {e}")
 
@@ -394,44 +496,34 @@ class SystemScanner:
         """Scan for large files that could be optimized."""
         logger.debug("Scanning for large files...")
         
-        large_file_paths = [
-            os.path.expanduser("~/Downloads"),
-            os.path.expanduser("~/Desktop"),
-            os.path.expanduser("~/Documents"),
-            os.path.expanduser("~/Pictures"),
-            os.path.expanduser("~/Videos"),
-            os.path.expanduser("~/Music")
-        ]
+        if self.config.scanning.quick_mode:
+            # Quick mode only checks the usual drop zones, shallowly
+            large_file_paths = self._home_dirs("Downloads", "Desktop")
+            max_depth = 2
+        else:
+            large_file_paths = self._home_dirs("Downloads", "Desktop", "Documents", "Pictures", "Videos", "Music")
+            max_depth = 4
         
         for path in large_file_paths:
-            if os.path.exists(path):
-                try:
-                    await self._scan_directory_for_large_files(path, max_depth=4)
-                except Exception as e:
-                    error_msg = f"Failed to scan for large files in {path}: {e}"
-                    logger.warning(error_msg)
-                    self.scan_errors.append(error_msg)
+            try:
+                await self._scan_directory_for_large_files(path, max_depth=max_depth)
+            except Exception as e:
+                error_msg = f"Failed to scan for large files in {path}: {e}"
+                logger.warning(error_msg)
+                self.scan_errors.append(error_msg)
 
     async def _scan_directory_for_large_files(self, path: str, max_depth: int = 3):
         """Scan directory for large files."""
+        async def handle(entry: os.DirEntry):
+            st = entry.stat()
+            if stat.S_ISREG(st.st_mode) and st.st_size > 10 * 1024 * 1024:  # Files > 10MB
+                file_info = await self._get_enhanced_file_info(entry.path, "large_file", st)
+                if file_info:
+                    self.large_files.append(file_info)
+                    self.scanned_files.append(file_info)
+        
         try:
-            for root, dirs, files in os.walk(path):
-                depth = root[len(path):].count(os.sep)
-                if depth > max_depth:
-                    continue
-                
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        stat = os.stat(file_path)
-                        if stat.st_size > 10 * 1024 * 1024:  # Files > 10MB
-                            file_info = await self._get_enhanced_file_info(file_path, "large_file")
-                            if file_info:
-                                self.large_files.append(file_info)
-                                self.scanned_files.append(file_info)
-                    except Exception as e:
-                        logger.debug(f"Error processing large file {file_path}: {e}")
-                        
+            await self._walk_files(path, max_depth, handle)
         except Exception as e:
             logger.warning(f"Error scanning large files in {path}: {e}")
 
@@ -439,48 +531,91 @@ class SystemScanner:
         """Scan for old files that might be candidates for cleanup."""
         logger.debug("Scanning for old files...")
         
-        old_file_paths = [
-            os.path.expanduser("~/Downloads"),
-            os.path.expanduser("~/Desktop"),
-            os.path.expanduser("~/Documents")
-        ]
+        old_file_paths = self._home_dirs("Downloads", "Desktop", "Documents")
         
         import time
         current_time = time.time()
         cutoff_time = current_time - (90 * 24 * 3600)  # 90 days ago
         
         for path in old_file_paths:
-            if os.path.exists(path):
-                try:
-                    await self._scan_directory_for_old_files(path, cutoff_time, max_depth=3)
-                except Exception as e:
-                    error_msg = f"Failed to scan for old files in {path}: {e}"
-                    logger.warning(error_msg)
-                    self.scan_errors.append(error_msg)
+            try:
+                await self._scan_directory_for_old_files(path, cutoff_time, max_depth=3)
+            except Exception as e:
+                error_msg = f"Failed to scan for old files in {path}: {e}"
+                logger.warning(error_msg)
+                self.scan_errors.append(error_msg)
 
     async def _scan_directory_for_old_files(self, path: str, cutoff_time: float, max_depth: int = 3):
         """Scan directory for old files."""
+        async def handle(entry: os.DirEntry):
+            st = entry.stat()
+            if stat.S_ISREG(st.st_mode) and st.st_mtime < cutoff_time:
+                file_info = await self._get_enhanced_file_info(entry.path, "old_file", st)
+                if file_info:
+                    self.old_files.append(file_info)
+                    self.scanned_files.append(file_info)
+        
         try:
-            for root, dirs, files in os.walk(path):
-                depth = root[len(path):].count(os.sep)
-                if depth > max_depth:
-                    continue
-                
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        stat = os.stat(file_path)
-                        if stat.st_mtime < cutoff_time:
-                            file_info = await self._get_enhanced_file_info(file_path, "old_file")
-                            if file_info:
-                                self.old_files.append(file_info)
-                                self.scanned_files.append(file_info)
-                    except Exception as e:
-                        logger.debug(f"Error processing old file {file_path}: {e}")
-                        
+            await self._walk_files(path, max_depth, handle)
         except Exception as e:
             logger.warning(f"Error scanning old files in {path}: {e}")
 
+    async def _walk_files(
+        self,
+        path: str,
+        max_depth: int,
+        handle: Callable[[os.DirEntry], Awaitable[None]],
+        workers: int = WALK_WORKERS
+    ):
+        """
+        Walk a directory tree and pass every file entry to a handler.
+        
+        Directory listings are read in a worker thread and queued, so the
+        next directory is read while consumer coroutines process the files
+        of the previous one. The bounded queue keeps the walker from
+        running arbitrarily far ahead of the handlers.
+        
+        Args:
+            path: Root directory to walk
+            max_depth: Maximum directory depth below the root to descend
+            handle: Coroutine function called with each file's DirEntry
+            workers: Number of consumer coroutines
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=WALK_QUEUE_SIZE)
+        
+        async def produce():
+            try:
+                stack = [(path, 0)]
+                while stack:
+                    directory, depth = stack.pop()
+                    try:
+                        entries = await to_thread(_list_directory, directory)
+                    except OSError as e:
+                        logger.debug(f"Error listing directory {directory}: {e}")
+                        continue
+                    
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if depth < max_depth:
+                                    stack.append((entry.path, depth + 1))
+                            else:
+                                await queue.put(entry)
+                        except OSError:
+                            continue
+            finally:
+                for _ in range(workers):
+                    await queue.put(None)
+        
+        async def consume():
+            while (entry := await queue.get()) is not None:
+                try:
+                    await handle(entry)
+                except Exception as e:
+                    logger.debug(f"Error processing file {entry.path}: {e}")
+        
+        await asyncio.gather(produce(), *(consume() for _ in range(workers)))
+
     async def _analyze_duplicates(self):
         """Analyze scanned files for duplicates."""
         logger.debug("Analyzing duplicates...")
@@ -492,9 +627,11 @@ class SystemScanner:
                 size_groups[file_info.size].append(file_info)
         
         # For files with same size, calculate hash
-        for size, files in size_groups.items():
-            if len(files) > 1:
-                await self._calculate_file_hashes(files)
+        await self._calculate_file_hashes([
+            file_info
+            for files in size_groups.values() if len(files) > 1
+            for file_info in files
+        ])
         
         # Group by hash
         hash_groups = defaultdict(list)
@@ -526,21 +663,57 @@ class SystemScanner:
                         file_info.risk_level = "low"
 
     async def _calculate_file_hashes(self, files: List[FileInfo]):
-        """Calculate MD5 hashes for files."""
-        for file_info in files:
-            try:
-                file_info.hash = await self._calculate_file_hash(file_info.path)
-            except Exception as e:
-                logger.debug(f"Error calculating hash for {file_info.path}: {e}")
+        """Calculate content hashes for files, several files at a time."""
+        semaphore = asyncio.Semaphore(os.cpu_count() or 4)
+        
+        async def hash_one(file_info: FileInfo):
+            async with semaphore:
+                try:
+                    file_info.hash = await to_thread(
+                        self._calculate_file_hash, file_info.path
+                    )
+                except Exception as e:
+                    logger.debug(f"Error calculating hash for {file_info.path}: {e}")
+        
+        await asyncio.gather(*(hash_one(file_info) for file_info in files))
 
-    async def _calculate_file_hash(self, file_path: str) -> str:
-        """Calculate MD5 hash of a file."""
-        hash_md5 = hashlib.md5()
+    @staticmethod
+    def _resolve_hash_algo(hash_algo: str) -> str:
+        """
+        Check ``scanning.hash_algo`` once, falling back to BLAKE2b.
+        
+        BLAKE3 needs the optional ``blake3`` package; any other name must be
+        a hashlib algorithm. Resolving it up front means a typo is reported
+        once instead of making every file hash fail.
+        """
+        if hash_algo == "blake3" and blake3 is not None:
+            return hash_algo
+        if hash_algo != "blake3" and hash_algo in hashlib.algorithms_available:
+            return hash_algo
+        logger.warning(f"Hash algorithm '{hash_algo}' is not available, using blake2b")
+        return "blake2b"
+
+    def _calculate_file_hash(self, file_path: str) -> str:
+        """
+        Calculate the content hash of a file.
+        
+        Uses the algorithm resolved from ``scanning.hash_algo``. BLAKE3
+        hashes large files straight from a memory map with its SIMD tree
+        mode; hashlib algorithms read the file in chunks.
+        """
         try:
+            if self.hash_algo == "blake3":
+                hasher = blake3.blake3()
+                if os.path.getsize(file_path) > HASH_CHUNK_SIZE:
+                    hasher.update_mmap(file_path)
+                    return hasher.hexdigest()
+            else:
+                hasher = hashlib.new(self.hash_algo)
+            
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
         except Exception as e:
             logger.debug(f"Error calculating hash for {file_path}: {e}")
             return ""
@@ -601,24 +774,32 @@ class SystemScanner:
             logger.debug(f"Error in photo analysis for {file_info.path}: {e}")
             return None
 
-    async def _get_enhanced_file_info(self, file_path: str, category: str) -> Optional[FileInfo]:
-        """Get enhanced file information including hash and metadata."""
+    async def _get_enhanced_file_info(
+        self,
+        file_path: str,
+        category: str,
+        st: Optional[os.stat_result] = None
+    ) -> Optional[FileInfo]:
+        """
+        Get enhanced file information including hash and metadata.
+        
+        Callers walking with ``os.scandir`` pass the ``DirEntry.stat()``
+        result they already have as ``st`` so the file isn't stat'ed again.
+        """
         try:
-            file_path_obj = Path(file_path)
-            
-            if not file_path_obj.exists() or not file_path_obj.is_file():
-                return None
-            
-            stat = file_path_obj.stat()
+            if st is None:
+                st = os.stat(file_path)
+                if not stat.S_ISREG(st.st_mode):
+                    return None
             
             file_info = FileInfo(
-                path=str(file_path_obj),
-                size=stat.st_size,
-                modified=stat.st_mtime,
-                file_type=self._get_file_type(file_path_obj),
+                path=file_path,
+                size=st.st_size,
+                modified=st.st_mtime,
+                file_type=self._get_file_type(file_path),
                 category=category,
-                safe_to_delete=self._is_safe_to_delete(file_path_obj, category),
-                risk_level=self._get_risk_level(file_path_obj, category)
+                safe_to_delete=self._is_safe_to_delete(file_path, category),
+                risk_level=self._get_risk_level(file_path, category)
             )
             
             return file_info
@@ -630,15 +811,20 @@ class SystemScanner:
     def _calculate_enhanced_scan_results(self, scan_duration: float) -> Dict[str, Any]:
         """Calculate enhanced scan results with duplicate and photo analysis."""
         total_files = len(self.scanned_files)
-        total_size = sum(f.size for f in self.scanned_files)
         
-        # Categorize files
+        # Categorize files and total their sizes in a single pass
         categories = defaultdict(list)
+        category_sizes = defaultdict(int)
         for file_info in self.scanned_files:
             categories[file_info.category].append(file_info)
+            category_sizes[file_info.category] += file_info.size
+        
+        total_size = sum(category_sizes.values())
         
         # Calculate potential savings
-        cache_savings = sum(f.size for f in self.scanned_files if "cache" in f.category)
+        cache_savings = sum(
+            size for category, size in category_sizes.items() if "cache" in category
+        )
         duplicate_savings = sum(group.potential_savings for group in self.duplicate_groups)
         photo_savings = sum(
             int(photo.size * (1 - (photo.compression_ratio or 0.7)))
@@ -656,7 +842,7 @@ class SystemScanner:
             "categories": {
                 category: {
                     "count": len(files),
-                    "size": sum(f.size for f in files),
+                    "size": category_sizes[category],
                     "files": [f.path for f in files[:10]]  # First 10 files
                 }
                 for category, files in categories.items()
@@ -719,9 +905,9 @@ class SystemScanner:
             "errors": self.scan_errors
         }
 
-    def _get_file_type(self, file_path: Path) -> str:
+    def _get_file_type(self, file_path: str) -> str:
         """Get the type of a file based on its extension."""
-        extension = file_path.suffix.lower()
+        extension = os.path.splitext(file_path)[1].lower()
         
         if extension in ['.log', '.log.1', '.log.2']:
             return "log"
@@ -738,55 +924,40 @@ class SystemScanner:
         else:
             return "other"
     
-    def _is_safe_to_delete(self, file_path: Path, category: str) -> bool:
+    def _is_safe_to_delete(self, file_path: str, category: str) -> bool:
         """Check if a file is safe to delete."""
-        file_path_str = str(file_path)
-        
         # Check whitelist
         for whitelist_path in self.config.security.whitelist_paths:
-            if whitelist_path in file_path_str:
+            if whitelist_path in file_path:
                 return False
         
         # Check blacklist
         for blacklist_path in self.config.security.blacklist_paths:
-            if blacklist_path in file_path_str:
+            if blacklist_path in file_path:
                 return False
         
-        # Check exclusion patterns
+        # Check exclusion patterns (path-aware, for patterns like "backup/*")
+        pure_path = PurePath(file_path)
         for pattern in self.config.scanning.exclude_patterns:
-            if file_path.match(pattern):
+            if pure_path.match(pattern):
                 return False
         
         # Category-specific checks
         if category == "system_cache":
             # Be more careful with system caches
-            return file_path_str.count("/") > 2  # Only deep system caches
+            return file_path.count("/") > 2  # Only deep system caches
         
         return True
     
-    def _get_risk_level(self, file_path: Path, category: str) -> str:
+    def _get_risk_level(self, file_path: str, category: str) -> str:
         """Determine the risk level of deleting a file."""
-        file_path_str = str(file_path)
-        
-        # High risk patterns
-        high_risk_patterns = [
-            "system", "library", "bin", "sbin", "usr/bin", "usr/sbin",
-            "windows", "system32", "syswow64", "program files"
-        ]
-        
-        for pattern in high_risk_patterns:
-            if pattern in file_path_str.lower():
-                return "high"
+        file_path_lower = file_path.lower()
         
-        # Medium risk patterns
-        medium_risk_patterns = [
-            "application support", "preferences", "settings",
-            "appdata", "local", "roaming"
-        ]
+        if _HIGH_RISK_RE.search(file_path_lower):
+            return "high"
         
-        for pattern in medium_risk_patterns:
-            if pattern in file_path_str.lower():
-                return "medium"
+        if _MEDIUM_RISK_RE.search(file_path_lower):
+            return "medium"
         
         return "low"
     
@@ -797,6 +968,35 @@ class SystemScanner:
                 return True
         return False
     
+    def _is_covered_by_scanned_root(self, root: str, max_depth: int, category: str) -> bool:
+        """
+        Check if an earlier _scan_directory call already walked this subtree.
+        
+        Locations nest (e.g. per-browser caches inside the user cache
+        directory), so without this check the same files would be walked,
+        classified and counted once per overlapping root. Only a walk of
+        the same category counts: a nested root of another category (the
+        temp directory inside a cache root, say) still has to be scanned
+        so its files are reported under their own category.
+        
+        Args:
+            root: Normalized absolute directory path about to be scanned
+            max_depth: Depth the new scan would descend to
+            category: Category the new scan assigns to its files
+            
+        Returns:
+            True if an ancestor scan of the same category reached at least as deep
+        """
+        for scanned_root, (scanned_depth, scanned_category) in self._scanned_roots.items():
+            if scanned_category != category:
+                continue
+            prefix = scanned_root.rstrip(os.sep)
+            if root == scanned_root or root.startswith(prefix + os.sep):
+                relative_depth = root[len(prefix):].count(os.sep)
+                if relative_depth + max_depth <= scanned_depth:
+                    return True
+        return False
+    
     def _calculate_scan_results(self, scan_duration: float) -> Dict[str, Any]:
         """Calculate scan results from collected file information."""
         if not self.scanned_files:
@@ -870,45 +1070,49 @@ class SystemScanner:
         logger.debug("Getting system status...")
         
         try:
-            import psutil
+            # The CPU sample blocks for a second; keep it off the event loop
+            return await to_thread(_collect_system_status)
             
-            # Get system information
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            
-            # Get process information
-            processes = len(psutil.pids())
-            
-            # Get network information
-            network = psutil.net_io_counters()
-            
-            status = {
-                "cpu_usage_percent": cpu_percent,
-                "memory_total_bytes": memory.total,
-                "memory_used_bytes": memory.used,
-                "memory_available_bytes": memory.available,
-                "memory_percent_used": memory.percent,
-                "disk_total_bytes": disk.total,
-                "disk_used_bytes": disk.used,
-                "disk_free_bytes": disk.free,
-                "disk_percent_used": disk.percent,
-                "process_count": processes,
-                "network_bytes_sent": network.bytes_sent,
-                "network_bytes_recv": network.bytes_recv,
+        except ImportError:
+            logger.warning("psutil not available, returning basic status")
+            return {
+                "error": "psutil not available",
                 "timestamp": time.time()
             }
+        except Exception as e:
+            logger.error(f"Failed to get system status: {e}")
+            return {
+                "error": str(e),
+                "timestamp": time.time()
+            }
+
+    async def get_resource_usage(self) -> Dict[str, Any]:
+        """
+        Get the fast-changing CPU and memory usage figures.
+        
+        A cheap subset of ``get_system_status`` for frequent polling: CPU
+        usage is measured since the previous call instead of blocking for
+        a one second sample, and no disk, process or network probes run.
+        
+        Returns:
+            Dictionary containing CPU and memory usage
+        """
+        try:
+            import psutil
             
-            return status
+            return {
+                "cpu_usage_percent": psutil.cpu_percent(interval=None),
+                "memory_percent_used": psutil.virtual_memory().percent,
+                "timestamp": time.time()
+            }
             
         except ImportError:
-            logger.warning("psutil not available, returning basic status")
             return {
                 "error": "psutil not available",
                 "timestamp": time.time()
             }
         except Exception as e:
-            logger.error(f"Failed to get system status: {e}")
+            logger.error(f"Failed to get resource usage: {e}")
             return {
                 "error": str(e),
                 "timestamp": time.time()
@@ -931,50 +1135,49 @@ class SystemScanner:
             file_patterns: Optional file patterns to match
         """
         try:
-            path_obj = Path(path)
-            
-            if not path_obj.exists():
+            # Depth counts the file name itself, so below 1 nothing matches
+            if max_depth < 1 or not os.path.isdir(path):
                 return
             
             # Check if path is excluded
-            if self._is_path_excluded(str(path_obj)):
+            if self._is_path_excluded(path):
                 return
             
-            # Scan directory
-            for file_path in path_obj.rglob("*"):
-                try:
-                    # Check depth
-                    if len(file_path.parts) - len(path_obj.parts) > max_depth:
-                        continue
-                    
-                    # Skip if not a file
-                    if not file_path.is_file():
-                        continue
-                    
-                    # Check file patterns if specified
-                    if file_patterns and not any(
-                        file_path.match(pattern) for pattern in file_patterns
-                    ):
-                        continue
-                    
-                    # Get file info
-                    file_info = await self._get_file_info(file_path, category)
-                    if file_info:
-                        self.scanned_files.append(file_info)
-                        
-                except (PermissionError, OSError) as e:
-                    # Skip files we can't access
-                    continue
+            # Skip roots whose whole subtree an earlier scan already covered
+            root = os.path.normpath(os.path.abspath(path))
+            if self._is_covered_by_scanned_root(root, max_depth, category):
+                logger.debug(f"Skipping {path}, already covered by an earlier scan")
+                return
+            if not file_patterns:
+                self._scanned_roots[root] = (max_depth, category)
+            
+            async def handle(entry: os.DirEntry):
+                if not entry.is_file():
+                    return
+                
+                # Path-aware, so patterns like "logs/*.log" keep working
+                if file_patterns:
+                    pure_path = PurePath(entry.path)
+                    if not any(pure_path.match(pattern) for pattern in file_patterns):
+                        return
+                
+                file_info = await self._get_file_info(entry, category)
+                if file_info:
+                    self.scanned_files.append(file_info)
+            
+            # max_depth counts path components below the root including the
+            # file name, while the walker counts directory levels
+            await self._walk_files(path, max_depth - 1, handle)
                     
         except Exception as e:
             logger.debug(f"Error scanning directory {path}: {e}")
 
-    async def _get_file_info(self, file_path: Path, category: str) -> Optional[FileInfo]:
+    async def _get_file_info(self, entry: os.DirEntry, category: str) -> Optional[FileInfo]:
         """
         Get information about a file.
         
         Args:
-            file_path: Path to the file
+            entry: Directory entry of the file, whose cached stat is reused
             category: Category of the file
             
         Returns:
@@ -982,7 +1185,8 @@ class SystemScanner:
         """
         try:
             # Get file stats
-            stat_info = file_path.stat()
+            stat_info = entry.stat()
+            file_path = entry.path
             
             # Check file age
             file_age_hours = (time.time() - stat_info.st_mtime) / 3600
@@ -1004,7 +1208,7 @@ class SystemScanner:
             risk_level = self._get_risk_level(file_path, category)
             
             return FileInfo(
-                path=str(file_path),
+                path=entry.path,
                 size=file_size,
                 modified=stat_info.st_mtime,
                 file_type=file_type,
@@ -5,12 +5,13 @@ This package contains utility modules for platform detection,
 CLI utilities, reporting, and other helper functions.
 """
 
-from .platform import detect_platform, get_system_paths, format_bytes
+from .platform import detect_platform, clear_platform_cache, get_system_paths, format_bytes
 from .cli_utils import print_banner, print_system_info, print_help
 from .reporting import ReportGenerator
 
 __all__ = [
     "detect_platform",
+    "clear_platform_cache",
     "get_system_paths", 
     "format_bytes",
     "print_banner",
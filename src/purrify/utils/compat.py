@@ -0,0 +1,23 @@
+"""
+Purrify Compatibility Helpers
+
+This module backports the few newer standard library features Purrify
+uses, so the package keeps running on its oldest supported Python (3.8).
+"""
+
+import asyncio
+import functools
+import sys
+
+# Keyword arguments for @dataclass: slotted classes (no per-instance
+# __dict__) need Python 3.10, older versions get regular dataclasses
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+if sys.version_info >= (3, 9):
+    to_thread = asyncio.to_thread
+else:
+    async def to_thread(func, *args, **kwargs):
+        """Run ``func`` in the loop's default executor, like ``asyncio.to_thread``."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
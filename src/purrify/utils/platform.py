@@ -7,20 +7,123 @@ cross-platform compatibility between macOS and Windows.
 
 import os
 import sys
+import json
 import platform
 import subprocess
+import functools
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from loguru import logger
 
+# On-disk copy of detect_platform(); bump the version when its keys change
+PLATFORM_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "purrify", "platform.json")
+PLATFORM_CACHE_VERSION = 2
 
+
+@functools.lru_cache(maxsize=1)
 def detect_platform() -> Dict[str, Any]:
     """
     Detect the current platform and return detailed information.
     
+    The result is cached for the life of the process because probing
+    shells out to ``sw_vers``/``cmd`` and cannot change while running.
+    It is also kept in ``PLATFORM_CACHE_PATH`` and reused by later runs
+    on the same OS release and Python build, as long as the probe that
+    produced it succeeded; ``clear_platform_cache()`` forces a fresh probe.
+    Volatile values such as ``total_memory`` are never cached on disk and
+    are read again by each process. Treat the returned dictionary as
+    read-only; copy it before adding keys.
+    
     Returns:
         Dictionary containing platform information
     """
+    fingerprint = _platform_fingerprint()
+    
+    try:
+        with open(PLATFORM_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['version'] == PLATFORM_CACHE_VERSION and cached['fingerprint'] == fingerprint:
+            return _with_volatile_info(cached['platform'])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # missing, stale format or unreadable, probe instead
+    
+    platform_info, complete = _probe_platform()
+    if not complete:
+        # Don't pin a partial result until the next --refresh-platform
+        return _with_volatile_info(platform_info)
+    
+    # Best effort: an unwritable cache directory just means probing next time
+    try:
+        os.makedirs(os.path.dirname(PLATFORM_CACHE_PATH), exist_ok=True)
+        payload = json.dumps({
+            'version': PLATFORM_CACHE_VERSION,
+            'fingerprint': fingerprint,
+            'platform': platform_info
+        })
+        tmp_path = f"{PLATFORM_CACHE_PATH}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, PLATFORM_CACHE_PATH)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write platform cache {PLATFORM_CACHE_PATH}: {e}")
+    
+    return _with_volatile_info(platform_info)
+
+
+def clear_platform_cache():
+    """Forget the cached platform information, in this process and on disk."""
+    detect_platform.cache_clear()
+    try:
+        os.remove(PLATFORM_CACHE_PATH)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove platform cache {PLATFORM_CACHE_PATH}: {e}")
+
+
+def _platform_fingerprint() -> str:
+    """Cheap key that changes whenever a fresh platform probe could differ."""
+    return f"{sys.platform}|{platform.release()}|{platform.machine()}|{sys.version}"
+
+
+def _with_volatile_info(platform_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the values that may change between runs, like installed memory."""
+    total_memory = _get_total_memory()
+    if total_memory is not None:
+        platform_info["total_memory"] = total_memory
+    return platform_info
+
+
+def _get_total_memory() -> Optional[int]:
+    """Get the installed memory in bytes, or None if it can't be read."""
+    try:
+        import psutil
+        return psutil.virtual_memory().total
+    except ImportError:
+        pass
+    
+    if sys.platform == "darwin":
+        try:
+            result = subprocess.run(
+                ["sysctl", "-n", "hw.memsize"],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            return int(result.stdout.strip())
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
+            logger.warning(f"Failed to get total memory: {e}")
+    
+    return None
+
+
+def _probe_platform() -> Tuple[Dict[str, Any], bool]:
+    """
+    Probe the running system for ``detect_platform()``.
+    
+    Returns:
+        Tuple of the platform information and whether every probe succeeded
+    """
     system = platform.system().lower()
     release = platform.release()
     version = platform.version()
@@ -40,21 +143,24 @@ def detect_platform() -> Dict[str, Any]:
     }
     
     # Platform-specific information
+    complete = True
     if system == "darwin":  # macOS
-        platform_info.update(_get_macos_info())
+        info, complete = _get_macos_info()
+        platform_info.update(info)
     elif system == "windows":
-        platform_info.update(_get_windows_info())
+        info, complete = _get_windows_info()
+        platform_info.update(info)
     else:
         platform_info["supported"] = False
         logger.warning(f"Unsupported platform: {system}")
     
     platform_info["supported"] = system in ["darwin", "windows"]
     
-    return platform_info
+    return platform_info, complete
 
 
-def _get_macos_info() -> Dict[str, Any]:
-    """Get macOS-specific system information."""
+def _get_macos_info() -> Tuple[Dict[str, Any], bool]:
+    """Get macOS-specific system information, and whether it is complete."""
     info = {
         "platform_type": "macOS",
         "supported": True
@@ -97,23 +203,15 @@ def _get_macos_info() -> Dict[str, Any]:
         )
         info["is_apple_silicon"] = result.stdout.strip() == "arm64"
         
-        # Get system memory info
-        result = subprocess.run(
-            ["sysctl", "-n", "hw.memsize"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        info["total_memory"] = int(result.stdout.strip())
-        
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
         logger.warning(f"Failed to get macOS info: {e}")
+        return info, False
     
-    return info
+    return info, True
 
 
-def _get_windows_info() -> Dict[str, Any]:
-    """Get Windows-specific system information."""
+def _get_windows_info() -> Tuple[Dict[str, Any], bool]:
+    """Get Windows-specific system information, and whether it is complete."""
     info = {
         "platform_type": "Windows",
         "supported": True
@@ -138,14 +236,11 @@ def _get_windows_info() -> Dict[str, Any]:
         )
         info["windows_build"] = result.stdout.strip()
         
-        # Get system memory info
-        import psutil
-        info["total_memory"] = psutil.virtual_memory().total
-        
-    except (subprocess.CalledProcessError, ImportError) as e:
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
         logger.warning(f"Failed to get Windows info: {e}")
+        return info, False
     
-    return info
+    return info, True
 
 
 def get_system_paths() -> Dict[str, List[str]]:
@@ -498,7 +593,7 @@ def get_system_info() -> Dict[str, Any]:
     Returns:
         Dictionary containing system information
     """
-    info = detect_platform()
+    info = dict(detect_platform())
     
     # Add disk usage
     info["disk_usage"] = get_disk_usage()